@@ -3,15 +3,195 @@
 SQLite를 사용하여 파트넘버 정보를 캐싱
 """
 
+import atexit
+import bisect
+import difflib
+import heapq
+import logging
 import sqlite3
 import os
-from datetime import datetime
-from typing import Dict, Optional
+import queue
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+# marisa-trie가 설치되어 있으면 유사 파트넘버 후보 검색에 사용 (선택 사항, 없으면 정렬 목록 + 이진 탐색)
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+# rapidfuzz가 설치되어 있으면 유사 파트넘버 후보의 순위 계산에 사용 (선택 사항, 없으면 difflib)
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
+
+logger = logging.getLogger(__name__)
+
+
+def _flush_api_calls_at_exit(db_ref):
+    """프로그램 종료 시 아직 기록되지 않은 API 호출 횟수 저장"""
+    db = db_ref()
+    if db is not None:
+        db.flush_api_calls()
 
 
 class PartDatabase:
     """파트넘버 데이터베이스 클래스"""
     
+    # parts 테이블 컬럼 정의 (생성 및 마이그레이션에 공통 사용)
+    # 시간 컬럼은 ISO 문자열 그대로 저장/조회하므로 TEXT로 선언
+    _PARTS_COLUMNS = """
+        part_number TEXT NOT NULL,
+        manufacturer TEXT NOT NULL,
+        mounting_type TEXT NOT NULL,
+        description TEXT,
+        product_url TEXT,
+        datasheet_url TEXT,
+        quantity_available INTEGER,
+        unit_price REAL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (part_number)
+    """
+    
+    # 자주 실행되는 SQL 문 (sqlite3 문장 캐시에서 재사용됨)
+    # 결과 딕셔너리 키 이름으로 별칭을 지정하고 기본값 처리도 SQL에서 수행
+    _PART_RESULT_COLUMNS = """
+               part_number AS PartNumber,
+               manufacturer AS Manufacturer,
+               mounting_type AS MountingType,
+               COALESCE(NULLIF(description, ''), 'N/A') AS Description,
+               COALESCE(product_url, '') AS ProductUrl,
+               COALESCE(datasheet_url, '') AS DatasheetUrl,
+               COALESCE(quantity_available, 0) AS QuantityAvailable,
+               COALESCE(unit_price, 0) AS UnitPrice,
+               created_at AS CreatedAt,
+               updated_at AS UpdatedAt
+    """
+    
+    _SQL_GET_PART = f"""
+        SELECT {_PART_RESULT_COLUMNS}
+        FROM parts
+        WHERE part_number = ?
+    """
+    
+    # 여러 파트넘버 일괄 조회 (IN 목록의 자리표시자는 실행 시 채움)
+    _SQL_GET_PARTS_IN = f"""
+        SELECT {_PART_RESULT_COLUMNS}
+        FROM parts
+        WHERE part_number IN ({{placeholders}})
+    """
+    
+    # 기존 행은 삭제하지 않고 갱신하므로 created_at이 그대로 유지됨
+    # 시간은 SQLite에서 계산 (로컬 시간, ISO 형식)
+    _SQL_UPSERT_PART = """
+        INSERT INTO parts (
+            part_number, manufacturer, mounting_type, description,
+            product_url, datasheet_url, quantity_available, unit_price,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?,
+            strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'),
+            strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+        )
+        ON CONFLICT(part_number) DO UPDATE SET
+            manufacturer = excluded.manufacturer,
+            mounting_type = excluded.mounting_type,
+            description = excluded.description,
+            product_url = excluded.product_url,
+            datasheet_url = excluded.datasheet_url,
+            quantity_available = excluded.quantity_available,
+            unit_price = excluded.unit_price,
+            updated_at = excluded.updated_at
+    """
+    
+    # 저장하면서 저장된 행을 get_part와 같은 형태로 돌려받음 (SQLite 3.35 이상)
+    _SQL_UPSERT_PART_RETURNING = f"{_SQL_UPSERT_PART} RETURNING {_PART_RESULT_COLUMNS}"
+    _UPSERT_RETURNING_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35, 0)
+    
+    _SQL_GET_ALL_PARTS = "SELECT part_number FROM parts ORDER BY part_number"
+    _SQL_GET_PART_KEYS = "SELECT part_number FROM parts"
+    
+    # 조회 실패로 저장된 결과의 제조사 값 (유사 파트 후보에서 제외)
+    FAILED_MANUFACTURERS = ('검색 결과 없음', 'API 오류', '조회 실패', '오류 발생')
+    
+    _SQL_GET_FOUND_PARTS = f"""
+        SELECT part_number FROM parts
+        WHERE manufacturer NOT IN ({', '.join('?' * len(FAILED_MANUFACTURERS))})
+    """
+    
+    _SQL_ADD_API_CALLS = """
+        INSERT INTO api_calls (call_date, call_count)
+        VALUES (?, ?)
+        ON CONFLICT(call_date) DO UPDATE SET
+            call_count = call_count + excluded.call_count
+    """
+    
+    _SQL_GET_API_CALLS = """
+        SELECT call_count FROM api_calls
+        WHERE call_date = ?
+    """
+    
+    _SQL_GET_API_CALL_STATS = """
+        SELECT call_date, call_count
+        FROM api_calls
+        ORDER BY call_date DESC
+        LIMIT ?
+    """
+    
+    _SQL_GET_PART_STATS = """
+        SELECT COUNT(*),
+               COUNT(DISTINCT manufacturer),
+               COUNT(DISTINCT CASE WHEN mounting_type != 'N/A' THEN mounting_type END)
+        FROM parts
+    """
+    
+    _SQL_PRUNE_API_CALLS = """
+        DELETE FROM api_calls
+        WHERE call_date < date('now', 'localtime', ?)
+    """
+    
+    # API 호출 이력 보관 기간(일)
+    API_CALL_KEEP_DAYS = 365
+    
+    # 비어 있는 페이지가 이 수 이상일 때만 종료 시 공간 회수 (매번 쓰기 작업을 하지 않음)
+    COMPACT_MIN_FREE_PAGES = 256
+    
+    # get_part 결과를 메모리에 보관할 최대 개수 (LRU)
+    PART_CACHE_SIZE = 4096
+    
+    # batch() 구간에서 모아 둔 저장을 한 번의 트랜잭션으로 기록하는 개수
+    BATCH_FLUSH_COUNT = 100
+    
+    # 일괄 조회 시 한 번의 IN 쿼리에 넣을 최대 파트넘버 수 (SQLite 변수 개수 제한 999 이하)
+    BULK_QUERY_CHUNK_SIZE = 500
+    
+    # 유휴 상태로 보관할 읽기 전용 연결 최대 개수
+    READER_POOL_SIZE = 4
+    
+    # API 호출 횟수는 메모리에 모아 두었다가 아래 조건 중 하나를 만족하면 DB에 기록
+    API_CALL_FLUSH_COUNT = 20  # 누적 호출 수
+    API_CALL_FLUSH_SECONDS = 5.0  # 첫 누적 후 경과 시간(초)
+    
+    # DB에 기록된 오늘 호출 횟수를 메모리에서 재사용하는 시간(초) - 화면 갱신마다 SQLite 조회 방지
+    API_CALL_COUNT_CACHE_SECONDS = 5.0
+    
+    # 유사 파트넘버 후보 검색: 앞/뒤 몇 글자가 같은 파트넘버를 후보로 사용
+    SIMILAR_KEY_LENGTH = 4
+    SIMILAR_MAX_CANDIDATES = 200
+    SIMILAR_INDEX_REBUILD_COUNT = 100  # 새로 저장된 파트가 이만큼 쌓이면 색인 재생성
+    
+    # 오늘 날짜 문자열 캐시 (초 단위로만 다시 계산)
+    _cached_today = ''
+    _cached_today_ts = 0.0
+    
     def __init__(self, db_path: str = "parts_cache.db"):
         """
         초기화
@@ -20,41 +200,61 @@ class PartDatabase:
             db_path: 데이터베이스 파일 경로
         """
         self.db_path = db_path
-        self.connection = None
+        self.connection = None  # 쓰기 전용 연결 (1개)
+        self._write_lock = threading.Lock()
+        self._readers = queue.Queue(maxsize=self.READER_POOL_SIZE)  # 읽기 전용 연결 풀
+        # 메모리 DB는 연결 간 공유가 불가능하므로 쓰기 연결로 읽기도 처리
+        self._reader_uri = None
+        if db_path != ":memory:":
+            self._reader_uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        self._pending_api_calls = 0  # 아직 DB에 기록되지 않은 API 호출 횟수
+        self._pending_date = None  # 누적 중인 호출 횟수의 날짜
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        self._recorded_calls = None  # (날짜, DB에 기록된 호출 횟수, 조회 시각) - get_today_api_calls 캐시
+        self._part_cache = OrderedDict()  # 파트넘버 -> 파트 정보 (최근 사용 순)
+        self._part_cache_lock = threading.Lock()
+        self._part_cache_version = 0  # 저장 시 증가 (조회 중 저장된 오래된 값의 캐시 방지)
+        self._known_parts = None  # DB에 있는 파트넘버 집합 (첫 조회 시 한 번에 로드, 없는 파트는 SQL 없이 판단)
+        self._similar_index = None  # (접두어 색인, 접미어 색인, 대문자 -> 원래 파트넘버) - 색인은 트라이 또는 정렬 목록
+        self._similar_recent = {}  # 색인 생성 이후 저장된 파트넘버 (대문자 -> 원래 파트넘버)
+        self._similar_lock = threading.Lock()
+        self._batch_depth = 0  # batch() 중첩 횟수 (0보다 크면 저장을 모아 둠)
+        self._batch_parts = {}  # 아직 기록하지 않은 저장 (파트넘버 -> 파트 정보, 같은 파트는 마지막 값)
+        self._batch_lock = threading.Lock()
         self.init_database()
+        atexit.register(_flush_api_calls_at_exit, weakref.ref(self))
     
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # isolation_level=None: 자동 트랜잭션을 끄고 쓰기 작업은 명시적으로 BEGIN/COMMIT 처리
+            # detect_types=0: 타입 변환기를 사용하지 않음 (시간 값은 문자열 그대로 사용)
+            self.connection = sqlite3.connect(
+                self.db_path,
+                detect_types=0,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=256
+            )
+            self.connection.row_factory = sqlite3.Row
+            self._apply_pragmas(self.connection)
             cursor = self.connection.cursor()
             
-            # 파트넘버 정보 테이블 생성
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS parts (
-                    part_number TEXT PRIMARY KEY,
-                    manufacturer TEXT NOT NULL,
-                    mounting_type TEXT NOT NULL,
-                    description TEXT,
-                    product_url TEXT,
-                    datasheet_url TEXT,
-                    quantity_available INTEGER,
-                    unit_price REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            # 기존 rowid 테이블이면 WITHOUT ROWID 테이블로 변환
+            self._migrate_parts_without_rowid()
             
-            # 인덱스 생성 (검색 성능 향상)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_manufacturer 
-                ON parts(manufacturer)
-            """)
+            # auto_vacuum 설정 전에 만들어진 기존 DB 파일은 한 번만 VACUUM하여 INCREMENTAL 적용
+            # (이후에는 compact의 incremental_vacuum으로 공간 회수)
+            if self.db_path != ":memory:" and cursor.execute("PRAGMA auto_vacuum").fetchone()[0] == 0:
+                cursor.execute("VACUUM")
             
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_mounting_type 
-                ON parts(mounting_type)
-            """)
+            # 파트넘버 정보 테이블 생성 (part_number 기준 클러스터드 저장)
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS parts ({self._PARTS_COLUMNS}) WITHOUT ROWID")
+            
+            # 제조사/마운팅타입 인덱스는 조회에 사용되지 않고 저장 시 부담만 되므로 제거
+            cursor.execute("DROP INDEX IF EXISTS idx_manufacturer")
+            cursor.execute("DROP INDEX IF EXISTS idx_mounting_type")
             
             # API 호출 통계 테이블 생성
             cursor.execute("""
@@ -66,11 +266,124 @@ class PartDatabase:
                 )
             """)
             
-            self.connection.commit()
+            # 최근 이력 조회(get_api_call_stats)를 테이블 접근 없이 인덱스만으로 처리
+            # (날짜 조건이 고정되지 않아 부분 인덱스 대신 prune_api_calls로 오래된 이력을 정리)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_api_calls_cover
+                ON api_calls(call_date DESC, call_count)
+            """)
             
-        except sqlite3.Error as e:
-            print(f"데이터베이스 초기화 오류: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("데이터베이스 초기화 오류")
             raise
+        
+        # 보관 기간이 지난 API 호출 이력은 시작할 때 한 번만 정리
+        self.prune_api_calls()
+    
+    def _migrate_parts_without_rowid(self):
+        """
+        이전 버전에서 생성된 rowid 기반 parts 테이블을 WITHOUT ROWID 테이블로 변환
+        
+        파트넘버가 곧 저장 순서(클러스터드 인덱스)가 되어 조회 시 B-tree 탐색이 한 번으로 줄어든다.
+        """
+        row = self.connection.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'parts'"
+        ).fetchone()
+        if not row or 'WITHOUT ROWID' in row[0].upper():
+            return
+        
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.execute(f"CREATE TABLE parts_new ({self._PARTS_COLUMNS}) WITHOUT ROWID")
+            self.connection.execute("""
+                INSERT INTO parts_new (
+                    part_number, manufacturer, mounting_type, description,
+                    product_url, datasheet_url, quantity_available, unit_price,
+                    created_at, updated_at
+                )
+                SELECT part_number, manufacturer, mounting_type, description,
+                       product_url, datasheet_url, quantity_available, unit_price,
+                       created_at, updated_at
+                FROM parts
+                WHERE part_number IS NOT NULL
+            """)
+            self.connection.execute("DROP TABLE parts")
+            self.connection.execute("ALTER TABLE parts_new RENAME TO parts")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+    
+    def _apply_pragmas(self, connection: sqlite3.Connection, read_only: bool = False):
+        """
+        연결 성능 설정 (WAL 저널, 동기화 수준, 캐시 크기 등)
+        
+        WAL 모드에서는 읽기와 쓰기가 서로 차단하지 않으며,
+        synchronous=NORMAL로 커밋마다 발생하는 fsync 횟수를 줄인다.
+        
+        Args:
+            connection: 설정을 적용할 연결
+            read_only: 읽기 전용 연결 여부 (저널 모드는 쓰기 연결에서만 설정)
+        """
+        cursor = connection.cursor()
+        
+        # 삭제/갱신으로 비워진 페이지를 incremental_vacuum으로 회수할 수 있도록 설정
+        # (테이블이 생성되기 전인 새 DB 파일에서만 적용됨)
+        if not read_only:
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        
+        # 메모리 DB에는 WAL을 적용할 수 없음
+        if not read_only and self.db_path != ":memory:":
+            cursor.execute("PRAGMA journal_mode=WAL")
+            journal_mode = cursor.fetchone()[0]
+            if str(journal_mode).lower() != "wal":
+                logger.warning("WAL 모드 적용 실패 (현재 모드: %s)", journal_mode)
+        
+        cursor.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA busy_timeout=5000;
+            PRAGMA mmap_size=268435456;
+        """)
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """읽기 전용 연결 생성"""
+        connection = sqlite3.connect(
+            self._reader_uri,
+            uri=True,
+            detect_types=0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        connection.row_factory = sqlite3.Row
+        self._apply_pragmas(connection, read_only=True)
+        return connection
+    
+    @contextmanager
+    def _reader(self):
+        """
+        읽기 전용 연결을 풀에서 빌려오고 사용 후 반납
+        
+        WAL 모드에서는 읽기 연결이 쓰기 연결과 병렬로 동작한다.
+        """
+        if self._reader_uri is None:
+            yield self.connection
+            return
+        
+        try:
+            connection = self._readers.get_nowait()
+        except queue.Empty:
+            connection = self._open_reader()
+        
+        try:
+            yield connection
+        finally:
+            try:
+                self._readers.put_nowait(connection)
+            except queue.Full:
+                connection.close()
     
     def get_part(self, part_number: str) -> Optional[Dict]:
         """
@@ -85,39 +398,98 @@ class PartDatabase:
         if not self.connection:
             return None
         
+        key = part_number.strip()
+        
+        # 아직 기록하지 않은 저장이 있으면 먼저 기록 (저장 직후 조회에서도 최신 값을 반환)
+        if key in self._batch_parts:
+            self.flush_batch()
+        
+        # 메모리 캐시 확인
+        with self._part_cache_lock:
+            cached = self._part_cache.get(key)
+            if cached is not None:
+                self._part_cache.move_to_end(key)
+                return dict(cached)
+            version = self._part_cache_version
+            if self._known_parts is None:
+                self._load_known_parts()
+            if self._known_parts is not None and key not in self._known_parts:
+                return None
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT part_number, manufacturer, mounting_type, description,
-                       product_url, datasheet_url, quantity_available, unit_price,
-                       created_at, updated_at
-                FROM parts
-                WHERE part_number = ?
-            """, (part_number.strip(),))
-            
-            row = cursor.fetchone()
+            with self._reader() as reader:
+                row = reader.execute(self._SQL_GET_PART, (key,)).fetchone()
             
             if row:
-                return {
-                    'PartNumber': row[0],
-                    'Manufacturer': row[1],
-                    'MountingType': row[2],
-                    'Description': row[3] or 'N/A',
-                    'ProductUrl': row[4] or '',
-                    'DatasheetUrl': row[5] or '',
-                    'QuantityAvailable': row[6] or 0,
-                    'UnitPrice': row[7] or 0,
-                    'CreatedAt': row[8],
-                    'UpdatedAt': row[9],
-                    'Source': 'Database'  # DB에서 조회된 것임을 표시
-                }
+                part = dict(row)
+                part['Source'] = 'Database'  # DB에서 조회된 것임을 표시
+                with self._part_cache_lock:
+                    if version == self._part_cache_version:
+                        self._cache_part(key, part)
+                return part
             
             return None
             
-        except sqlite3.Error as e:
-            print(f"데이터베이스 조회 오류 ({part_number}): {str(e)}")
+        except sqlite3.Error:
+            logger.exception("데이터베이스 조회 오류 (%s)", part_number)
             return None
     
+    def get_parts_bulk(self, part_numbers: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 파트넘버 정보를 한 번에 조회 (메모리 캐시에 없는 것만 IN 쿼리로 묶어서 조회)
+        
+        Args:
+            part_numbers: 파트넘버 목록
+            
+        Returns:
+            dict: {파트넘버(앞뒤 공백 제거): 파트 정보} - DB에 없는 파트넘버는 포함되지 않음
+        """
+        if not self.connection:
+            return {}
+        
+        part_numbers = [pn.strip() for pn in part_numbers]
+        if self._batch_parts and not self._batch_parts.keys().isdisjoint(part_numbers):
+            self.flush_batch()
+        
+        found = {}
+        missing = []
+        with self._part_cache_lock:
+            if self._known_parts is None:
+                self._load_known_parts()
+            known = self._known_parts
+            for key in dict.fromkeys(part_numbers):
+                cached = self._part_cache.get(key)
+                if cached is not None:
+                    self._part_cache.move_to_end(key)
+                    found[key] = dict(cached)
+                elif known is None or key in known:
+                    missing.append(key)
+            version = self._part_cache_version
+        
+        if not missing:
+            return found
+        
+        try:
+            with self._reader() as reader:
+                for start in range(0, len(missing), self.BULK_QUERY_CHUNK_SIZE):
+                    chunk = missing[start:start + self.BULK_QUERY_CHUNK_SIZE]
+                    sql = self._SQL_GET_PARTS_IN.format(placeholders=",".join("?" * len(chunk)))
+                    for row in reader.execute(sql, chunk):
+                        part = dict(row)
+                        part['Source'] = 'Database'
+                        found[part['PartNumber']] = part
+            
+            with self._part_cache_lock:
+                if version == self._part_cache_version:
+                    for key in missing:
+                        if key in found:
+                            self._cache_part(key, found[key])
+            return found
+            
+        except sqlite3.Error:
+            logger.exception("데이터베이스 일괄 조회 오류")
+            return found
+    
     def save_part(self, part_data: Dict) -> bool:
         """
         파트넘버 정보를 데이터베이스에 저장
@@ -126,47 +498,304 @@ class PartDatabase:
             part_data: 파트 정보 딕셔너리
             
         Returns:
-            bool: 저장 성공 여부
+            bool: 저장 성공 여부 (batch() 구간에서는 모아 두기만 하면 True,
+                  BATCH_FLUSH_COUNT개가 쌓여 기록했는데 실패하면 False - 실패한 저장은 버리지 않고 다시 모아 둠)
         """
+        if self._batch_depth:
+            return self._buffer_parts([part_data])
+        if not self._UPSERT_RETURNING_SUPPORTED:
+            return self._write_parts([part_data])
         if not self.connection:
             return False
         
+        row = self._part_row(part_data)
+        part_number = row[0]
         try:
-            cursor = self.connection.cursor()
+            # 저장과 저장된 행 조회를 한 문장으로 처리하고 결과를 메모리 캐시에 바로 넣음
+            # (다음 get_part가 SQL 조회 없이 캐시에서 응답)
+            with self._write_lock:
+                # fetchall로 문장을 끝까지 실행해야 자동 커밋됨
+                stored = self.connection.execute(self._SQL_UPSERT_PART_RETURNING, row).fetchall()
+                self._invalidate_parts([part_number])
+                if stored:
+                    part = dict(stored[0])
+                    part['Source'] = 'Database'
+                    with self._part_cache_lock:
+                        self._cache_part(part_number, part)
+            if row[1] not in self.FAILED_MANUFACTURERS:
+                self._add_similar_candidates([part_number])
+            return True
             
-            # 현재 시간
-            now = datetime.now().isoformat()
+        except sqlite3.Error:
+            logger.exception("데이터베이스 저장 오류")
+            return False
+    
+    @staticmethod
+    def _part_row(part_data: Dict) -> tuple:
+        """파트 정보 딕셔너리를 저장용 행 (parts 테이블 컬럼 순서)으로 변환"""
+        return (
+            part_data.get('PartNumber', '').strip(),
+            part_data.get('Manufacturer', 'N/A'),
+            part_data.get('MountingType', 'N/A'),
+            part_data.get('Description', 'N/A'),
+            part_data.get('ProductUrl', ''),
+            part_data.get('DatasheetUrl', ''),
+            part_data.get('QuantityAvailable', 0),
+            part_data.get('UnitPrice', 0)
+        )
+    
+    def save_parts_bulk(self, parts: Iterable[Dict]) -> bool:
+        """
+        여러 파트넘버 정보를 하나의 트랜잭션으로 일괄 저장
+        
+        Args:
+            parts: 파트 정보 딕셔너리 목록
             
-            # UPSERT (INSERT OR REPLACE)
-            cursor.execute("""
-                INSERT OR REPLACE INTO parts (
-                    part_number, manufacturer, mounting_type, description,
-                    product_url, datasheet_url, quantity_available, unit_price,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 
-                    COALESCE((SELECT created_at FROM parts WHERE part_number = ?), ?),
-                    ?
-                )
-            """, (
-                part_data.get('PartNumber', '').strip(),
-                part_data.get('Manufacturer', 'N/A'),
-                part_data.get('MountingType', 'N/A'),
-                part_data.get('Description', 'N/A'),
-                part_data.get('ProductUrl', ''),
-                part_data.get('DatasheetUrl', ''),
-                part_data.get('QuantityAvailable', 0),
-                part_data.get('UnitPrice', 0),
-                part_data.get('PartNumber', '').strip(),  # created_at 유지용
-                now,  # 새로 생성 시 created_at
-                now   # updated_at
-            ))
-            
-            self.connection.commit()
+        Returns:
+            bool: 저장 성공 여부 (batch() 구간에서는 모아 두기만 하면 True,
+                  BATCH_FLUSH_COUNT개가 쌓여 기록했는데 실패하면 False - 실패한 저장은 버리지 않고 다시 모아 둠)
+        """
+        if self._batch_depth:
+            return self._buffer_parts(parts)
+        return self._write_parts(parts)
+    
+    @contextmanager
+    def batch(self):
+        """
+        이 구간의 저장(save_part, save_parts_bulk)을 모아 두었다가 묶어서 기록
+        
+        BATCH_FLUSH_COUNT개가 쌓이거나 구간이 끝날 때 한 번의 트랜잭션(커밋 1회)으로 기록한다.
+        모아 둔 파트넘버를 조회하면 그 전에 먼저 기록하므로 조회 결과는 바로 저장한 것과 같다.
+        
+        사용 예:
+            with part_db.batch():
+                part_db.save_part(...)
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._batch_lock:
+                self._batch_depth -= 1
+                finished = self._batch_depth == 0
+            if finished and not self.flush_batch():
+                logger.warning("모아 둔 저장 %d건을 기록하지 못해 다음 기록 시 재시도합니다.", len(self._batch_parts))
+    
+    def flush_batch(self) -> bool:
+        """
+        batch() 구간에서 모아 둔 저장을 DB에 기록
+        
+        기록에 실패하면(DB 잠김 등) 모아 둔 저장을 다시 넣어 두어 다음 기록(다음 flush_batch, close)에서 재시도한다.
+        기록하는 동안 같은 파트넘버가 새로 저장되었으면 새 값을 유지한다.
+        
+        Returns:
+            bool: 기록 성공 여부 (모아 둔 저장이 없으면 True)
+        """
+        with self._batch_lock:
+            pending = self._batch_parts
+            self._batch_parts = {}
+        if not pending:
+            return True
+        if self._write_parts(pending.values()):
             return True
+        
+        with self._batch_lock:
+            pending.update(self._batch_parts)
+            self._batch_parts = pending
+        return False
+    
+    def _buffer_parts(self, parts: Iterable[Dict]) -> bool:
+        """batch() 구간의 저장을 모아 두고, BATCH_FLUSH_COUNT개가 쌓이면 기록"""
+        with self._batch_lock:
+            for part_data in parts:
+                self._batch_parts[part_data.get('PartNumber', '').strip()] = part_data
+            full = len(self._batch_parts) >= self.BATCH_FLUSH_COUNT
+        if full:
+            return self.flush_batch()
+        return True
+    
+    def _write_parts(self, parts: Iterable[Dict]) -> bool:
+        """
+        여러 파트넘버 정보를 하나의 트랜잭션으로 DB에 기록
+        
+        Args:
+            parts: 파트 정보 딕셔너리 목록
             
-        except sqlite3.Error as e:
-            print(f"데이터베이스 저장 오류: {str(e)}")
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not self.connection:
             return False
+        
+        saved_keys = []
+        found_keys = []
+        
+        def rows():
+            for part_data in parts:
+                row = self._part_row(part_data)
+                saved_keys.append(row[0])
+                if row[1] not in self.FAILED_MANUFACTURERS:
+                    found_keys.append(row[0])
+                yield row
+        
+        try:
+            # 쓰기 잠금을 먼저 잡고 모든 행을 한 번의 커밋으로 저장
+            with self._write_lock:
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self.connection.executemany(self._SQL_UPSERT_PART, rows())
+                except BaseException:
+                    self.connection.execute("ROLLBACK")
+                    raise
+                self.connection.execute("COMMIT")
+                # 커밋 이후에 무효화해야 다른 스레드가 이전 값을 다시 캐시하지 않음
+                self._invalidate_parts(saved_keys)
+            self._add_similar_candidates(found_keys)
+            return True
+            
+        except sqlite3.Error:
+            logger.exception("데이터베이스 저장 오류")
+            return False
+    
+    def _cache_part(self, part_number: str, part: Dict):
+        """파트 정보를 메모리 캐시에 추가 (_part_cache_lock을 잡은 상태에서 호출)"""
+        self._part_cache[part_number] = dict(part)
+        self._part_cache.move_to_end(part_number)
+        if len(self._part_cache) > self.PART_CACHE_SIZE:
+            self._part_cache.popitem(last=False)
+    
+    def _load_known_parts(self):
+        """
+        DB에 있는 모든 파트넘버를 한 번의 조회로 집합에 로드 (_part_cache_lock을 잡은 상태에서 호출)
+        
+        잠금을 잡은 채 로드하므로 로드 중 커밋된 저장도 _invalidate_parts에서 빠짐없이 반영된다.
+        실패하면 None으로 두어 파트마다 SQL로 조회한다.
+        """
+        try:
+            with self._reader() as reader:
+                self._known_parts = {row[0] for row in reader.execute(self._SQL_GET_PART_KEYS)}
+        except sqlite3.Error:
+            logger.exception("데이터베이스 조회 오류")
+            self._known_parts = None
+    
+    def _invalidate_parts(self, part_numbers: Iterable[str]):
+        """저장된 파트넘버를 메모리 캐시에서 제거하고 DB 파트넘버 집합에 추가"""
+        with self._part_cache_lock:
+            self._part_cache_version += 1
+            for part_number in part_numbers:
+                self._part_cache.pop(part_number, None)
+                if self._known_parts is not None:
+                    self._known_parts.add(part_number)
+    
+    def _add_similar_candidates(self, part_numbers: Iterable[str]):
+        """새로 저장된 조회 성공 파트넘버를 유사 후보 색인에 추가"""
+        with self._similar_lock:
+            if self._similar_index is None:
+                return  # 아직 색인이 없으면 처음 검색할 때 DB 전체로 생성
+            prefix_index, suffix_index, originals = self._similar_index
+            for part_number in part_numbers:
+                if not part_number:
+                    continue
+                key = part_number.upper()
+                if isinstance(prefix_index, list):
+                    # 정렬 목록은 삽입 위치를 이진 탐색으로 찾아 바로 추가
+                    if key not in originals:
+                        bisect.insort(prefix_index, key)
+                        bisect.insort(suffix_index, key[::-1])
+                    originals[key] = part_number
+                else:
+                    # 트라이는 수정할 수 없으므로 따로 모았다가 일정 개수마다 재생성
+                    self._similar_recent[key] = part_number
+            if len(self._similar_recent) >= self.SIMILAR_INDEX_REBUILD_COUNT:
+                self._similar_index = None
+                self._similar_recent = {}
+    
+    def _build_similar_index(self):
+        """조회 성공 파트넘버 전체로 접두어/접미어 색인 생성 (트라이 또는 정렬 목록)"""
+        originals = {}
+        with self._reader() as reader:
+            for (part_number,) in reader.execute(self._SQL_GET_FOUND_PARTS, self.FAILED_MANUFACTURERS):
+                if part_number:
+                    originals[part_number.upper()] = part_number
+        if marisa_trie is not None:
+            return marisa_trie.Trie(originals), marisa_trie.Trie(key[::-1] for key in originals), originals
+        return sorted(originals), sorted(key[::-1] for key in originals), originals
+    
+    @staticmethod
+    def _keys_with_prefix(index, prefix: str) -> list:
+        """색인에서 prefix로 시작하는 키 목록 반환 (정렬 목록이면 이진 탐색으로 범위 계산)"""
+        if isinstance(index, list):
+            lo = bisect.bisect_left(index, prefix)
+            hi = bisect.bisect_left(index, prefix + '\uffff', lo)
+            return index[lo:hi]
+        return index.keys(prefix)
+    
+    def find_similar_part_numbers(self, part_number: str) -> list:
+        """
+        앞 또는 뒤 SIMILAR_KEY_LENGTH 글자가 같은 저장된 파트넘버 검색 (대소문자 무시)
+        
+        DB 전체를 훑지 않고 트라이(marisa-trie가 없으면 정렬 목록의 이진 탐색)에서 후보만
+        골라내므로, 유사도 계산은 후보에만 수행하면 된다. 조회 실패로 저장된 파트넘버는 제외한다.
+        
+        Args:
+            part_number: 기준 파트넘버
+            
+        Returns:
+            list: 후보 파트넘버 목록 (유사도가 높은 순서로 최대 SIMILAR_MAX_CANDIDATES개, 기준 파트넘버 제외)
+        """
+        key = (part_number or '').strip().upper()
+        if not self.connection or len(key) < self.SIMILAR_KEY_LENGTH:
+            return []
+        
+        # 모아 둔 저장이 있으면 색인에 반영되도록 먼저 기록
+        if self._batch_parts:
+            self.flush_batch()
+        
+        prefix = key[:self.SIMILAR_KEY_LENGTH]
+        suffix = key[-self.SIMILAR_KEY_LENGTH:]
+        try:
+            # 정렬 목록 색인은 저장 시 수정되므로 검색과 원래 이름 변환까지 잠금 안에서 처리
+            with self._similar_lock:
+                if self._similar_index is None:
+                    self._similar_index = self._build_similar_index()
+                prefix_index, suffix_index, originals = self._similar_index
+                matched = set(self._keys_with_prefix(prefix_index, prefix))
+                matched.update(k[::-1] for k in self._keys_with_prefix(suffix_index, suffix[::-1]))
+                recent = self._similar_recent
+                matched.update(k for k in recent if k.startswith(prefix) or k.endswith(suffix))
+                matched.discard(key)
+                names = {k: recent.get(k) or originals[k] for k in matched}
+        except sqlite3.Error:
+            logger.exception("유사 파트넘버 색인 생성 오류")
+            return []
+        
+        # 앞/뒤 글자가 흔한 경우(예: RC06, -ND) 후보가 매우 많으므로 유사도가 높은 순서로 남김
+        return [names[k] for k in self._top_similar_keys(key, names)]
+    
+    def _top_similar_keys(self, key: str, keys) -> list:
+        """
+        기준 키와 유사도가 높은 키를 순서대로 반환 (같은 유사도는 이름 순)
+        
+        Args:
+            key: 기준 파트넘버 (대문자)
+            keys: 후보 키 목록 (대문자)
+            
+        Returns:
+            list: 최대 SIMILAR_MAX_CANDIDATES개의 키
+        """
+        keys = sorted(keys)
+        if process is not None:
+            matches = process.extract(key, keys, scorer=fuzz.ratio, limit=self.SIMILAR_MAX_CANDIDATES)
+            return [choice for choice, _, _ in matches]
+        
+        matcher = difflib.SequenceMatcher(None, "", key)  # 기준 키(seq2)의 분석 결과를 후보마다 재사용
+        
+        def score(k):
+            matcher.set_seq1(k)
+            return matcher.ratio()
+        
+        return heapq.nlargest(self.SIMILAR_MAX_CANDIDATES, keys, key=score)
     
     def get_all_parts(self) -> list:
         """
@@ -175,45 +804,110 @@ class PartDatabase:
         Returns:
             list: 파트넘버 리스트
         """
+        return list(self.iter_all_parts())
+    
+    def iter_all_parts(self) -> Iterator[str]:
+        """
+        데이터베이스의 모든 파트넘버를 순서대로 하나씩 반환
+        
+        전체 목록을 메모리에 올리지 않고 fetchmany 단위로 나누어 읽는다.
+        
+        Yields:
+            str: 파트넘버
+        """
         if not self.connection:
-            return []
+            return
         
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT part_number FROM parts ORDER BY part_number")
-            return [row[0] for row in cursor.fetchall()]
+            with self._reader() as reader:
+                cursor = reader.execute(self._SQL_GET_ALL_PARTS)
+                cursor.arraysize = 1000
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row[0]
             
-        except sqlite3.Error as e:
-            print(f"데이터베이스 조회 오류: {str(e)}")
-            return []
+        except sqlite3.Error:
+            logger.exception("데이터베이스 조회 오류")
+    
+    @classmethod
+    def _today(cls) -> str:
+        """오늘 날짜(ISO 형식) 반환 - 1초 이내의 반복 호출은 캐시된 값을 사용"""
+        now = time.monotonic()
+        if now - cls._cached_today_ts >= 1.0:
+            cls._cached_today = date.today().isoformat()
+            cls._cached_today_ts = now
+        return cls._cached_today
     
     def increment_api_call(self) -> bool:
         """
         오늘 날짜의 API 호출 횟수 증가
         
+        호출마다 커밋하지 않고 메모리에 누적한 뒤 일정 횟수 또는 일정 시간이 지나면
+        flush_api_calls()로 한 번에 기록한다.
+        
+        Returns:
+            bool: 성공 여부
+        """
+        if not self.connection:
+            return False
+        
+        today = self._today()
+        if self._pending_date is not None and self._pending_date != today:
+            # 날짜가 바뀌었으면 이전 날짜의 누적분을 먼저 기록
+            self.flush_api_calls()
+        
+        with self._pending_lock:
+            self._pending_date = today
+            self._pending_api_calls += 1
+            pending = self._pending_api_calls
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.API_CALL_FLUSH_SECONDS, self.flush_api_calls)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        if pending >= self.API_CALL_FLUSH_COUNT:
+            return self.flush_api_calls()
+        return True
+    
+    def flush_api_calls(self) -> bool:
+        """
+        메모리에 누적된 API 호출 횟수를 DB에 기록
+        
         Returns:
             bool: 성공 여부
         """
+        with self._pending_lock:
+            delta = self._pending_api_calls
+            call_date = self._pending_date
+            self._pending_api_calls = 0
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        
+        if delta == 0:
+            return True
         if not self.connection:
             return False
         
         try:
-            cursor = self.connection.cursor()
-            today = datetime.now().date().isoformat()
-            
             # 오늘 날짜의 레코드가 있으면 증가, 없으면 생성
-            cursor.execute("""
-                INSERT INTO api_calls (call_date, call_count)
-                VALUES (?, 1)
-                ON CONFLICT(call_date) DO UPDATE SET
-                    call_count = call_count + 1
-            """, (today,))
-            
-            self.connection.commit()
+            with self._write_lock:
+                self.connection.execute(self._SQL_ADD_API_CALLS, (call_date, delta))
+            with self._pending_lock:
+                # 직접 기록한 횟수는 캐시에도 반영 (다음 조회에서 이중 계산/누락 방지)
+                recorded = self._recorded_calls
+                if recorded is not None and recorded[0] == call_date:
+                    self._recorded_calls = (call_date, recorded[1] + delta, recorded[2])
             return True
             
-        except sqlite3.Error as e:
-            print(f"API 호출 카운트 증가 오류: {str(e)}")
+        except sqlite3.Error:
+            # 기록하지 못한 횟수는 다음 기록 시 다시 시도
+            with self._pending_lock:
+                self._pending_api_calls += delta
+            logger.exception("API 호출 카운트 증가 오류")
             return False
     
     def get_today_api_calls(self) -> int:
@@ -227,19 +921,25 @@ class PartDatabase:
             return 0
         
         try:
-            cursor = self.connection.cursor()
-            today = datetime.now().date().isoformat()
-            
-            cursor.execute("""
-                SELECT call_count FROM api_calls
-                WHERE call_date = ?
-            """, (today,))
-            
-            row = cursor.fetchone()
-            return row[0] if row else 0
+            today = self._today()
+            now = time.monotonic()
+            recorded = self._recorded_calls
+            if (recorded is not None and recorded[0] == today
+                    and now - recorded[2] < self.API_CALL_COUNT_CACHE_SECONDS):
+                count = recorded[1]
+            else:
+                with self._reader() as reader:
+                    row = reader.execute(self._SQL_GET_API_CALLS, (today,)).fetchone()
+                count = row[0] if row else 0
+                self._recorded_calls = (today, count, now)
+            # 아직 기록되지 않은 오늘 호출 횟수 포함
+            with self._pending_lock:
+                if self._pending_date == today:
+                    count += self._pending_api_calls
+            return count
             
-        except sqlite3.Error as e:
-            print(f"API 호출 횟수 조회 오류: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("API 호출 횟수 조회 오류")
             return 0
     
     def get_api_call_stats(self, limit: int = 30) -> list:
@@ -255,21 +955,66 @@ class PartDatabase:
         if not self.connection:
             return []
         
+        self.flush_api_calls()
+        
         try:
-            cursor = self.connection.cursor()
+            with self._reader() as reader:
+                rows = reader.execute(self._SQL_GET_API_CALL_STATS, (limit,)).fetchall()
+            return [{'date': row[0], 'count': row[1]} for row in rows]
             
-            cursor.execute("""
-                SELECT call_date, call_count
-                FROM api_calls
-                ORDER BY call_date DESC
-                LIMIT ?
-            """, (limit,))
+        except sqlite3.Error:
+            logger.exception("API 통계 조회 오류")
+            return []
+    
+    def prune_api_calls(self, keep_days: int = API_CALL_KEEP_DAYS) -> int:
+        """
+        보관 기간이 지난 API 호출 이력 삭제
+        
+        Args:
+            keep_days: 보관할 일수
             
-            return [{'date': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        Returns:
+            int: 삭제된 레코드 수
+        """
+        if not self.connection:
+            return 0
+        
+        try:
+            with self._write_lock:
+                cursor = self.connection.execute(self._SQL_PRUNE_API_CALLS, (f"-{int(keep_days)} days",))
+            return cursor.rowcount
             
-        except sqlite3.Error as e:
-            print(f"API 통계 조회 오류: {str(e)}")
-            return []
+        except sqlite3.Error:
+            logger.exception("API 호출 이력 정리 오류")
+            return 0
+    
+    def compact(self, pages: int = 1000) -> bool:
+        """
+        비어 있는 페이지를 파일에서 회수 (전체 VACUUM 없이 점진적으로 수행)
+        
+        비어 있는 페이지가 COMPACT_MIN_FREE_PAGES개 미만이면 아무것도 하지 않는다.
+        
+        Args:
+            pages: 한 번에 회수할 최대 페이지 수
+            
+        Returns:
+            bool: 성공 여부
+        """
+        if not self.connection:
+            return False
+        
+        try:
+            with self._write_lock:
+                if self.connection.execute("PRAGMA freelist_count").fetchone()[0] < self.COMPACT_MIN_FREE_PAGES:
+                    return True
+                # execute()는 한 단계만 실행되어 한 페이지만 회수하므로 executescript 사용
+                # (PRAGMA는 바인딩 인자를 받지 않으므로 정수로 변환하여 사용)
+                self.connection.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+            return True
+            
+        except sqlite3.Error:
+            logger.exception("데이터베이스 공간 회수 오류")
+            return False
     
     def get_stats(self) -> Dict:
         """
@@ -282,19 +1027,11 @@ class PartDatabase:
             return {}
         
         try:
-            cursor = self.connection.cursor()
-            
-            # 전체 파트 수
-            cursor.execute("SELECT COUNT(*) FROM parts")
-            total_parts = cursor.fetchone()[0]
-            
-            # 제조사 수
-            cursor.execute("SELECT COUNT(DISTINCT manufacturer) FROM parts")
-            total_manufacturers = cursor.fetchone()[0]
-            
-            # 마운팅 타입 수
-            cursor.execute("SELECT COUNT(DISTINCT mounting_type) FROM parts WHERE mounting_type != 'N/A'")
-            total_mounting_types = cursor.fetchone()[0]
+            # 전체 파트 수, 제조사 수, 마운팅 타입 수를 테이블 1회 스캔으로 집계
+            with self._reader() as reader:
+                total_parts, total_manufacturers, total_mounting_types = reader.execute(
+                    self._SQL_GET_PART_STATS
+                ).fetchone()
             
             # 오늘 API 호출 횟수
             today_calls = self.get_today_api_calls()
@@ -306,16 +1043,32 @@ class PartDatabase:
                 'today_api_calls': today_calls
             }
             
-        except sqlite3.Error as e:
-            print(f"통계 정보 조회 오류: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("통계 정보 조회 오류")
             return {}
     
     def close(self):
-        """데이터베이스 연결 종료"""
-        if self.connection:
+        """모아 둔 저장과 API 호출 수를 기록한 뒤 데이터베이스 연결 종료 (읽기 전용 연결 풀 포함)"""
+        if getattr(self, 'connection', None):
+            if getattr(self, '_batch_parts', None):
+                self.flush_batch()
+            self.flush_api_calls()
+            self.compact()
+        self._close_connections()
+    
+    def _close_connections(self):
+        """데이터베이스 연결만 종료 (기록 작업 없음)"""
+        readers = getattr(self, '_readers', None)
+        while readers is not None:
+            try:
+                readers.get_nowait().close()
+            except queue.Empty:
+                break
+        
+        if getattr(self, 'connection', None):
             self.connection.close()
             self.connection = None
     
     def __del__(self):
-        """소멸자: 데이터베이스 연결 종료"""
-        self.close()
+        """소멸자: 데이터베이스 연결만 종료 (GC/인터프리터 종료 중에는 쓰기 작업을 하지 않음)"""
+        self._close_connections()
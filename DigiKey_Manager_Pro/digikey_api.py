@@ -4,11 +4,88 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import json
 import os
+import random
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
+# orjson이 설치되어 있으면 검색 응답 파싱에 사용 (표준 json보다 2~5배 빠름, 선택 사항)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+# httpx와 h2가 설치되어 있으면 HTTP/2 연결 사용 가능 (use_http2=True, 선택 사항)
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx의 HTTP/2 지원에 필요
+except ImportError:
+    httpx = None
+
+# aiohttp가 설치되어 있으면 비동기 검색(asearch_part, asearch_parts_bulk) 사용 가능 (선택 사항)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# 네트워크/HTTP 오류로 처리할 예외 (requests 세션과 httpx 클라이언트 공용)
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# 비동기 검색에서 네트워크 오류로 처리할 예외 (aiohttp가 없으면 비어 있음)
+_AIO_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp is not None else ()
+
+# 결과 딕셔너리 템플릿 (실패가 많을 때 매번 같은 딕셔너리를 새로 만들지 않도록 복사해서 사용)
+_EMPTY_RESULT_TEMPLATE = MappingProxyType({
+    "PartNumber": "",
+    "Manufacturer": "N/A",
+    "MountingType": "N/A",
+    "Description": "N/A",
+    "ProductUrl": "",
+    "DatasheetUrl": "",
+    "QuantityAvailable": 0,
+    "UnitPrice": 0
+})
+_NOT_FOUND_TEMPLATE = MappingProxyType({
+    "PartNumber": "",
+    "Manufacturer": "검색 결과 없음",
+    "MountingType": "N/A",
+    "Description": "파트넘버를 찾을 수 없습니다."
+})
+_API_ERROR_TEMPLATE = MappingProxyType({
+    "PartNumber": "",
+    "Manufacturer": "API 오류",
+    "MountingType": "N/A",
+    "Error": ""
+})
+_ERROR_TEMPLATE = MappingProxyType({
+    "PartNumber": "",
+    "Manufacturer": "오류 발생",
+    "MountingType": "N/A",
+    "Error": ""
+})
+
+
+def _result_from_template(template, part_number: str, error: str = None) -> Dict:
+    """템플릿을 복사해 파트넘버(와 오류 메시지)를 채운 결과 딕셔너리 반환"""
+    result = template.copy()
+    result["PartNumber"] = part_number
+    if error is not None:
+        result["Error"] = error
+    return result
+
 
 class RateLimitExceeded(Exception):
     """API 호출 한도 초과 예외"""
@@ -17,14 +94,103 @@ class RateLimitExceeded(Exception):
         self.retry_after = retry_after
 
 
+class TokenBucket:
+    """
+    요청 속도 제한기 (토큰 버킷)
+    
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓인다. 요청 전에 acquire()로
+    토큰을 하나 가져가며, 토큰이 없으면 채워질 때까지 대기한다.
+    429 응답 시 속도를 절반으로 줄이고(decrease), 성공할 때마다 설정값까지
+    조금씩 늘린다(increase) - AIMD 방식.
+    """
+    
+    def __init__(self, rate: float, burst: float, min_rate: float = 0.1, increase_step: float = 0.05):
+        """
+        초기화
+        
+        Args:
+            rate: 초당 허용 요청 수 (최대값)
+            burst: 한 번에 허용되는 최대 요청 수
+            min_rate: 429 응답으로 줄일 수 있는 최소 속도
+            increase_step: 성공 시 늘리는 속도 (초당 요청 수)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase_step = increase_step
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+    
+    def acquire(self):
+        """토큰 하나를 가져옴 (없으면 채워질 때까지 대기)"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """토큰 하나를 가져옴 (비동기 버전, 대기 중 이벤트 루프를 막지 않음)"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+    
+    def decrease(self):
+        """429 응답 시 속도를 절반으로 감소"""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+    
+    def increase(self):
+        """요청 성공 시 속도를 설정값까지 조금씩 증가"""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
 class DigikeyAPIClient:
     """디지키 API 클라이언트 클래스"""
     
+    # 토큰 만료 이 시간(초) 전에 미리 갱신
+    TOKEN_EXPIRY_SAFETY_SEC = 60
+    
+    # 일시적 오류(429, 5xx) 재시도 설정 (decorrelated jitter 지수 백오프)
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BASE_DELAY = 0.5  # 최소 대기 시간(초)
+    RETRY_MAX_DELAY = 30.0  # 최대 대기 시간(초) - Retry-After가 이보다 길면 재시도하지 않음
+    
+    # 초당 최대 요청 수 (Product Information API 분당 120회 제한)
+    QPS_LIMIT = 2.0
+    
+    # 검색 결과 메모리 캐시 (파트넘버 -> 결과, 최근 사용 순)
+    SEARCH_CACHE_SIZE = 4096
+    NEGATIVE_CACHE_TTL = 600.0  # '검색 결과 없음'은 이 시간(초) 동안만 보관
+    DISK_CACHE_TTL = 86400.0  # 디스크 캐시의 조회 성공 결과 보관 시간(초) - 재고/가격이 바뀌므로 하루로 제한
+    
     # 디지키 API 엔드포인트 (샌드박스 환경)
     SANDBOX_BASE_URL = "https://sandbox-api.digikey.com"
     PRODUCTION_BASE_URL = "https://api.digikey.com"
+    _BASE_URLS = {True: SANDBOX_BASE_URL, False: PRODUCTION_BASE_URL}  # use_sandbox -> 기본 URL
     
-    def __init__(self, client_id: str = None, client_secret: str = None, use_sandbox: bool = False):
+    def __init__(self, client_id: str = None, client_secret: str = None, use_sandbox: bool = False,
+                 use_http2: bool = False, search_cache_path: str = None):
         """
         초기화
         
@@ -32,17 +198,47 @@ class DigikeyAPIClient:
             client_id: 디지키 API Client ID
             client_secret: 디지키 API Client Secret
             use_sandbox: 샌드박스 환경 사용 여부 (기본값: True)
+            use_http2: HTTP/2 사용 여부 (httpx, h2 설치 필요, 없으면 requests 세션 사용)
+            search_cache_path: 검색 결과 디스크 캐시(SQLite) 파일 경로 (None이면 메모리 캐시만 사용)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.use_sandbox = use_sandbox
         self.access_token = None
         self.refresh_token = None
-        self.token_expires_at = None
+        self.token_expires_at = None  # 만료 시각 (벽시계 기준, 표시/저장용)
+        self._token_deadline = None  # 만료 시각 (time.monotonic 기준, 유효성 판단용 - 시스템 시계 변경 영향 없음)
+        self.token_expiry_safety_sec = self.TOKEN_EXPIRY_SAFETY_SEC
+        self._token_lock = threading.Lock()  # 여러 스레드가 동시에 토큰을 갱신하지 않도록 보호
         self.token_file = "token.json"  # 토큰 저장 파일
+        self.max_retries = 5  # 일시적 오류 시 최대 재시도 횟수
+        self.qps_limit = self.QPS_LIMIT
+        self._limiter = TokenBucket(rate=self.qps_limit, burst=self.qps_limit)  # 429를 피하기 위한 사전 속도 제한
+        self._headers_cache = (None, None, None)  # (토큰, Client ID, 헤더) - 토큰이 바뀔 때만 재생성
+        self._search_url_cache = (None, None)  # (base_url, 검색 URL)
+        self._search_cache = OrderedDict()  # 정규화된 파트넘버 -> (결과, 만료 시각 또는 None)
+        self._search_cache_lock = threading.Lock()
+        self._search_cache_version = 0  # 캐시 비울 때 증가 (조회 중 비운 경우 오래된 결과 저장 방지)
+        self.search_cache_path = search_cache_path
+        self._disk_cache = None  # 디스크 캐시 연결 (처음 사용할 때 생성)
+        self._disk_cache_lock = threading.Lock()
+        self._aio_session = None  # 비동기 검색용 aiohttp 세션 (처음 사용할 때 생성)
+        self._aio_loop = None  # _aio_session이 속한 이벤트 루프
         
-        # API 기본 URL 설정
-        self.base_url = self.SANDBOX_BASE_URL if use_sandbox else self.PRODUCTION_BASE_URL
+        # HTTP 세션 (연결 재사용으로 매 호출마다 발생하는 TCP/TLS 연결 비용 제거)
+        self.use_http2 = use_http2 and httpx is not None
+        if self.use_http2:
+            # HTTP/2는 동시 요청을 하나의 연결에서 다중화하므로 연결 수를 적게 유지
+            self._session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                timeout=30,
+            )
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
         
         # token.json 파일에서 토큰 로드 시도
         self.load_token_from_file()
@@ -58,6 +254,24 @@ class DigikeyAPIClient:
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None  # 새 인증 정보로 토큰 무효화
+        # 환경(샌드박스/프로덕션)이 바뀌면 결과도 달라지므로 메모리 캐시를 비움
+        # (디스크 캐시는 base_url별로 저장되므로 유지)
+        self._clear_memory_search_cache()
+    
+    def close(self):
+        """HTTP 세션과 디스크 캐시 연결 종료"""
+        self._session.close()
+        with self._disk_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+    
+    async def aclose(self):
+        """비동기 검색용 aiohttp 세션 종료"""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+        self._aio_loop = None
     
     def is_configured(self) -> bool:
         """API 설정이 완료되었는지 확인"""
@@ -69,36 +283,50 @@ class DigikeyAPIClient:
             try:
                 # UTF-8 BOM 처리 (utf-8-sig 사용)
                 with open(self.token_file, 'r', encoding='utf-8-sig') as f:
-                    content = f.read()
-                
-                # 빈 파일이거나 빈 내용인 경우 처리
-                if not content or not content.strip():
-                    return
-                
-                # JSON 형식 정리: 첫 번째 '{'부터 마지막 '}'까지 추출
-                start_idx = content.find('{')
-                end_idx = content.rfind('}')
+                    try:
+                        token_data = json.load(f)
+                    except json.JSONDecodeError:
+                        # 앞뒤에 불필요한 내용이 붙은 경우에만 복구 시도
+                        f.seek(0)
+                        token_data = self._recover_token_json(f.read())
                 
-                if start_idx == -1 or end_idx == -1 or end_idx <= start_idx:
-                    print("token.json 파일에 유효한 JSON 객체를 찾을 수 없습니다.")
+                if not isinstance(token_data, dict):
                     return
                 
-                json_content = content[start_idx:end_idx + 1]
-                token_data = json.loads(json_content)
-                
                 self.access_token = token_data.get("access_token")
                 self.refresh_token = token_data.get("refresh_token")
                 
                 # 만료 시간 계산
                 expires_in = token_data.get("expires_in", 0)
                 if expires_in > 0:
-                    self.token_expires_at = time.time() + expires_in - 100
+                    self._set_token_expiry(expires_in)
                     
             except json.JSONDecodeError as e:
                 print(f"token.json 파일 JSON 파싱 오류: {str(e)}")
             except Exception as e:
                 print(f"token.json 파일 읽기 오류: {str(e)}")
     
+    @staticmethod
+    def _recover_token_json(content: str) -> Optional[dict]:
+        """
+        손상된 token.json 내용에서 JSON 객체 복구 (첫 번째 '{'부터 마지막 '}'까지)
+        
+        Returns:
+            dict: 토큰 데이터 (빈 파일이거나 JSON 객체가 없으면 None)
+        """
+        # 빈 파일이거나 빈 내용인 경우 처리
+        if not content or not content.strip():
+            return None
+        
+        start_idx = content.find('{')
+        end_idx = content.rfind('}')
+        
+        if start_idx == -1 or end_idx == -1 or end_idx <= start_idx:
+            print("token.json 파일에 유효한 JSON 객체를 찾을 수 없습니다.")
+            return None
+        
+        return json.loads(content[start_idx:end_idx + 1])
+    
     def save_token_to_file(self, token_data: dict):
         """토큰을 token.json 파일에 저장"""
         try:
@@ -129,7 +357,8 @@ class DigikeyAPIClient:
         }
         
         try:
-            response = requests.post(token_url, headers=headers, data=data, timeout=15)
+            self._limiter.acquire()
+            response = self._session.post(token_url, headers=headers, data=data, timeout=15)
             
             if response.status_code == 401:
                 raise Exception("refresh_token이 만료되었거나 유효하지 않습니다. 새로 인증이 필요합니다.")
@@ -141,14 +370,14 @@ class DigikeyAPIClient:
             self.refresh_token = token_data.get("refresh_token", self.refresh_token)  # 새 refresh_token이 있으면 업데이트
             
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = time.time() + expires_in - 100
+            self._set_token_expiry(expires_in)
             
             # 토큰 저장
             self.save_token_to_file(token_data)
             
             return self.access_token
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             raise Exception(f"토큰 갱신 중 오류가 발생했습니다: {str(e)}")
     
     def get_access_token(self) -> str:
@@ -162,9 +391,8 @@ class DigikeyAPIClient:
             raise Exception("API 인증 정보가 설정되지 않았습니다.")
         
         # 토큰이 아직 유효한 경우 재사용
-        if self.access_token and self.token_expires_at:
-            if time.time() < self.token_expires_at:
-                return self.access_token
+        if self._token_is_valid():
+            return self.access_token
         
         # refresh_token이 있으면 갱신 시도
         if self.refresh_token:
@@ -188,7 +416,8 @@ class DigikeyAPIClient:
         }
         
         try:
-            response = requests.post(token_url, headers=headers, data=data, timeout=15)
+            self._limiter.acquire()
+            response = self._session.post(token_url, headers=headers, data=data, timeout=15)
             
             # 응답 상태 코드 확인
             if response.status_code == 401:
@@ -216,9 +445,9 @@ class DigikeyAPIClient:
             if not self.access_token:
                 raise Exception("토큰 응답에 access_token이 없습니다.")
             
-            # 토큰 만료 시간 저장 (기본적으로 3600초 유효, 여유있게 3500초로 설정)
+            # 토큰 만료 시간 저장 (기본적으로 3600초 유효, 갱신 여유 시간은 _token_is_valid에서 적용)
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expires_at = time.time() + expires_in - 100
+            self._set_token_expiry(expires_in)
             
             # refresh_token이 있으면 저장
             if "refresh_token" in token_data:
@@ -229,75 +458,361 @@ class DigikeyAPIClient:
             
             return self.access_token
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             if hasattr(e, 'response') and e.response is not None:
                 if e.response.status_code == 401:
                     # 이미 위에서 처리했지만, 혹시 모를 경우를 위해
                     raise Exception(f"토큰 획득 중 인증 오류가 발생했습니다 (401): API 키와 환경 설정을 확인하세요.")
             raise Exception(f"토큰 획득 중 오류가 발생했습니다: {str(e)}")
     
+    def _set_token_expiry(self, expires_in: float):
+        """토큰 유효 시간(초)으로 만료 시각 설정"""
+        self._token_deadline = time.monotonic() + expires_in
+        self.token_expires_at = time.time() + expires_in
+    
+    def _token_is_valid(self) -> bool:
+        """캐시된 토큰이 만료 여유 시간 밖에서 아직 유효한지 확인"""
+        if not self.access_token or self._token_deadline is None:
+            return False
+        return time.monotonic() + self.token_expiry_safety_sec < self._token_deadline
+    
+    def _get_valid_token(self) -> str:
+        """
+        유효한 액세스 토큰 반환 (만료가 임박했으면 요청 전에 미리 갱신)
+        
+        Returns:
+            str: 액세스 토큰
+        """
+        if self._token_is_valid():
+            return self.access_token
+        with self._token_lock:
+            # 잠금을 기다리는 동안 다른 스레드가 이미 갱신했을 수 있음
+            return self.get_access_token()
+    
+    def invalidate_token(self):
+        """캐시된 액세스 토큰 무효화 (다음 요청 시 새로 발급)"""
+        self.access_token = None
+        self.token_expires_at = None
+        self._token_deadline = None
+    
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[int]:
+        """Retry-After 헤더(초 단위)를 정수로 변환 (없거나 형식이 다르면 None)"""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return int(retry_after) if retry_after is not None else None
+        except ValueError:
+            return None
+    
+    def _request_with_retry(self, method: str, url: str, **kwargs):
+        """
+        429/5xx 응답 시 지수 백오프(decorrelated jitter)로 재시도하는 HTTP 요청
+        
+        Retry-After 헤더가 있으면 그 시간만큼 기다린다. 단, 일일 한도 초과처럼
+        대기 시간이 RETRY_MAX_DELAY보다 길면 재시도하지 않고 응답을 그대로 반환한다.
+        400/401/404 등 다른 오류는 재시도하지 않는다.
+        
+        Returns:
+            requests.Response 또는 httpx.Response: 마지막 응답
+        """
+        delay = self.RETRY_BASE_DELAY
+        for attempt in range(self.max_retries + 1):
+            self._limiter.acquire()
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code == 429:
+                self._limiter.decrease()
+            elif response.status_code < 400:
+                self._limiter.increase()
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            
+            retry_after = self._parse_retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.RETRY_MAX_DELAY:
+                    return response
+                time.sleep(retry_after)
+            else:
+                delay = min(self.RETRY_MAX_DELAY, random.uniform(self.RETRY_BASE_DELAY, delay * 3))
+                time.sleep(delay)
+        return response
+    
+    def _search_headers(self, token: str) -> Dict:
+        """
+        검색 요청 헤더 반환 (토큰이나 Client ID가 바뀐 경우에만 새로 생성)
+        
+        반환된 딕셔너리는 여러 요청이 공유하므로 수정하지 않는다.
+        """
+        cached_token, cached_client_id, headers = self._headers_cache
+        if token != cached_token or self.client_id != cached_client_id:
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "X-DIGIKEY-Client-Id": self.client_id,
+                "X-DIGIKEY-Locale-Site": "US",
+                "X-DIGIKEY-Locale-Language": "en",
+                "X-DIGIKEY-Locale-Currency": "USD"
+            }
+            self._headers_cache = (token, self.client_id, headers)
+        return headers
+    
+    @property
+    def base_url(self) -> str:
+        """API 기본 URL (use_sandbox에 따라 결정 - 환경 전환은 use_sandbox만 바꾸면 됨)"""
+        return self._BASE_URLS[bool(self.use_sandbox)]
+    
+    @property
+    def search_url(self) -> str:
+        """키워드 검색 엔드포인트 URL (base_url이 바뀐 경우에만 새로 생성)"""
+        base_url, url = self._search_url_cache
+        if base_url != self.base_url:
+            url = f"{self.base_url}/products/v4/search/keyword"
+            self._search_url_cache = (self.base_url, url)
+        return url
+    
+    def _rate_limit_exceeded(self, response, body: bytes) -> RateLimitExceeded:
+        """429 응답으로부터 RateLimitExceeded 예외 생성 (requests/aiohttp 응답 공용)"""
+        retry_after = response.headers.get('Retry-After', '알 수 없음')
+        try:
+            detail = _json_loads(body).get('detail', '')
+            error_msg = f"API 일일 호출 제한 초과 (429 Too Many Requests)\n"
+            error_msg += f"상세: {detail}\n"
+            error_msg += f"재시도 가능 시간: {retry_after}초 후"
+        except Exception:
+            error_msg = f"API 호출 실패 (상태 코드: 429)"
+            error_msg += f"\n응답: {body[:200].decode('utf-8', 'replace')}"
+            error_msg += f"\n재시도 가능 시간: {retry_after}초 후"
+        return RateLimitExceeded(error_msg, self._parse_retry_after(response))
+    
+    @staticmethod
+    def _search_payload(keywords: str, record_count: int) -> dict:
+        """
+        키워드 검색 요청 데이터 생성
+        
+        v4 API는 Limit/Offset으로 반환 건수를 정하므로 함께 보내야 필요한 건수만 응답받는다
+        (RecordCount/RecordStartPosition은 이전 버전 호환용).
+        
+        Args:
+            keywords: 검색 키워드(파트넘버)
+            record_count: 반환받을 최대 건수 (최대 50)
+        """
+        record_count = min(record_count, 50)
+        return {
+            "Keywords": keywords,
+            "Limit": record_count,
+            "Offset": 0,
+            "RecordCount": record_count,
+            "RecordStartPosition": 0
+        }
+    
+    def _post_search(self, payload: dict, timeout: int = 30):
+        """
+        키워드 검색 API 호출 (토큰, 재시도, 속도 제한, 401/429 처리를 한 곳에서 담당)
+        
+        Args:
+            payload: 검색 요청 데이터
+            timeout: 요청 타임아웃(초)
+            
+        Returns:
+            requests.Response 또는 httpx.Response: 검색 응답 (429 외의 오류 응답도 그대로 반환)
+            
+        Raises:
+            RateLimitExceeded: 재시도 후에도 호출 한도 초과인 경우
+        """
+        # 액세스 토큰 획득 (만료 임박 시 미리 갱신)
+        headers = self._search_headers(self._get_valid_token())
+        response = self._request_with_retry("POST", self.search_url, headers=headers, json=payload, timeout=timeout)
+        
+        # 만료 전에 미리 갱신하므로 401은 시계 오차 등 예외적인 경우에만 발생
+        # → 토큰을 무효화하고 한 번만 재시도
+        if response.status_code == 401:
+            self.invalidate_token()
+            headers = self._search_headers(self._get_valid_token())
+            response = self._request_with_retry("POST", self.search_url, headers=headers, json=payload, timeout=timeout)
+        
+        # 429 오류 (일일 호출 제한 초과) → 조회 중단을 위해 예외 발생
+        if response.status_code == 429:
+            raise self._rate_limit_exceeded(response, response.content)
+        
+        return response
+    
+    @staticmethod
+    def _extract_search_results(data) -> Optional[list]:
+        """검색 응답에서 제품 목록 추출 (다양한 응답 구조 대응)"""
+        if isinstance(data, list):
+            return data
+        if "SearchResults" in data:
+            return data["SearchResults"]
+        if "Products" in data:
+            return data["Products"]
+        return None
+    
     def _product_to_result(self, product: dict, part_number: str) -> Dict:
         """API 응답의 product 딕셔너리를 공통 결과 형식으로 변환"""
-        if isinstance(product, list) and len(product) > 0:
+        if isinstance(product, list) and product:
             product = product[0]
         if not isinstance(product, dict):
-            return {
-                "PartNumber": part_number,
-                "Manufacturer": "N/A",
-                "MountingType": "N/A",
-                "Description": "N/A",
-                "ProductUrl": "",
-                "DatasheetUrl": "",
-                "QuantityAvailable": 0,
-                "UnitPrice": 0
-            }
-        manufacturer = "N/A"
-        if "Manufacturer" in product:
-            if isinstance(product["Manufacturer"], dict):
-                manufacturer = product["Manufacturer"].get("Name") or product["Manufacturer"].get("Value", "N/A")
-            elif isinstance(product["Manufacturer"], str):
-                manufacturer = product["Manufacturer"]
-        description = "N/A"
-        if "DetailedDescription" in product:
-            desc_value = product.get("DetailedDescription")
-            if isinstance(desc_value, dict):
-                description = desc_value.get("DetailedDescription") or desc_value.get("ProductDescription") or "N/A"
-            elif isinstance(desc_value, str):
-                description = desc_value
-        elif "Description" in product:
-            desc_value = product.get("Description")
-            if isinstance(desc_value, dict):
-                description = desc_value.get("DetailedDescription") or desc_value.get("ProductDescription") or "N/A"
-            elif isinstance(desc_value, str):
-                description = desc_value
-        result = {
-            "PartNumber": product.get("DigiKeyPartNumber") or product.get("PartNumber") or part_number,
-            "Manufacturer": manufacturer,
-            "MountingType": "N/A",
-            "Description": description,
-            "ProductUrl": product.get("ProductUrl") or product.get("Url") or "",
-            "DatasheetUrl": product.get("PrimaryDatasheet") or product.get("DatasheetUrl") or "",
-            "QuantityAvailable": product.get("QuantityAvailable", 0),
-            "UnitPrice": 0
-        }
-        if "StandardPricing" in product and product["StandardPricing"]:
-            if isinstance(product["StandardPricing"], list) and len(product["StandardPricing"]) > 0:
-                result["UnitPrice"] = product["StandardPricing"][0].get("UnitPrice", 0)
-        params = product.get("Parameters", [])
+            return _result_from_template(_EMPTY_RESULT_TEMPLATE, part_number)
+        get = product.get
+        
+        mfr = get("Manufacturer")
+        if isinstance(mfr, dict):
+            manufacturer = mfr.get("Name") or mfr.get("Value", "N/A")
+        else:
+            manufacturer = mfr if isinstance(mfr, str) else "N/A"
+        
+        # DetailedDescription 키가 있으면 값이 비어 있어도 Description보다 우선
+        desc_value = product["DetailedDescription"] if "DetailedDescription" in product else get("Description")
+        if isinstance(desc_value, dict):
+            description = desc_value.get("DetailedDescription") or desc_value.get("ProductDescription") or "N/A"
+        else:
+            description = desc_value if isinstance(desc_value, str) else "N/A"
+        
+        pricing = get("StandardPricing")
+        unit_price = pricing[0].get("UnitPrice", 0) if isinstance(pricing, list) and pricing else 0
+        
+        mounting_type = "N/A"
+        params = get("Parameters")
         if isinstance(params, list):
             for param in params:
-                if isinstance(param, dict):
-                    param_text = param.get("ParameterText") or param.get("Parameter") or param.get("Name", "")
-                    if param_text == "Mounting Type":
-                        result["MountingType"] = param.get("ValueText") or param.get("Value", "N/A")
-                        break
+                if isinstance(param, dict) and (
+                    param.get("ParameterText") or param.get("Parameter") or param.get("Name", "")
+                ) == "Mounting Type":
+                    mounting_type = param.get("ValueText") or param.get("Value", "N/A")
+                    break
         elif isinstance(params, dict):
-            result["MountingType"] = params.get("MountingType") or params.get("Mounting Type", "N/A")
-        return result
+            mounting_type = params.get("MountingType") or params.get("Mounting Type", "N/A")
+        
+        return {
+            "PartNumber": get("DigiKeyPartNumber") or get("PartNumber") or part_number,
+            "Manufacturer": manufacturer,
+            "MountingType": mounting_type,
+            "Description": description,
+            "ProductUrl": get("ProductUrl") or get("Url") or "",
+            "DatasheetUrl": get("PrimaryDatasheet") or get("DatasheetUrl") or "",
+            "QuantityAvailable": get("QuantityAvailable", 0),
+            "UnitPrice": unit_price
+        }
+    
+    @staticmethod
+    def _search_cache_key(part_number: str) -> str:
+        """검색 캐시 키 (앞뒤 공백 제거, 대문자 변환)"""
+        return part_number.strip().upper()
+    
+    def is_search_cached(self, part_number: str) -> bool:
+        """
+        파트넘버의 검색 결과가 메모리 캐시에 있는지 확인 (API 호출 횟수 집계용)
+        
+        Args:
+            part_number: 파트넘버
+            
+        Returns:
+            bool: 만료되지 않은 캐시 결과가 있으면 True
+        """
+        key = self._search_cache_key(part_number)
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+                return True
+        return self._disk_cache_get(key) is not None
+    
+    def clear_search_cache(self):
+        """검색 결과 캐시 비우기 (메모리와 디스크 모두)"""
+        self._clear_memory_search_cache()
+        connection = self._get_disk_cache()
+        if connection is None:
+            return
+        try:
+            with self._disk_cache_lock:
+                connection.execute("DELETE FROM search_cache")
+        except sqlite3.Error as e:
+            print(f"검색 캐시 삭제 오류: {str(e)}")
+    
+    def _clear_memory_search_cache(self):
+        """검색 결과 메모리 캐시 비우기"""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+            self._search_cache_version += 1
+    
+    def _get_disk_cache(self) -> Optional[sqlite3.Connection]:
+        """디스크 캐시 연결 반환 (search_cache_path가 없으면 None, 처음 사용할 때 생성)"""
+        if not self.search_cache_path:
+            return None
+        if self._disk_cache is not None:
+            return self._disk_cache
+        with self._disk_cache_lock:
+            if self._disk_cache is None:
+                try:
+                    connection = sqlite3.connect(
+                        self.search_cache_path, check_same_thread=False, isolation_level=None
+                    )
+                    connection.executescript("""
+                        PRAGMA journal_mode=WAL;
+                        PRAGMA synchronous=NORMAL;
+                        PRAGMA busy_timeout=5000;
+                        CREATE TABLE IF NOT EXISTS search_cache (
+                            key TEXT NOT NULL,
+                            base_url TEXT NOT NULL,
+                            fetched_at REAL NOT NULL,
+                            expires_at REAL NOT NULL,
+                            payload BLOB NOT NULL,
+                            PRIMARY KEY (key, base_url)
+                        ) WITHOUT ROWID;
+                    """)
+                    # 만료된 항목 정리
+                    connection.execute("DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),))
+                    self._disk_cache = connection
+                except sqlite3.Error as e:
+                    print(f"검색 캐시 파일 열기 오류: {str(e)}")
+                    self.search_cache_path = None  # 다시 시도하지 않고 메모리 캐시만 사용
+                    return None
+            return self._disk_cache
+    
+    def _disk_cache_get(self, key: str) -> Optional[tuple]:
+        """
+        디스크 캐시 조회
+        
+        Returns:
+            tuple: (결과, 남은 유효 시간(초)) 또는 None
+        """
+        connection = self._get_disk_cache()
+        if connection is None:
+            return None
+        now = time.time()
+        try:
+            with self._disk_cache_lock:
+                row = connection.execute(
+                    "SELECT payload, expires_at FROM search_cache WHERE key = ? AND base_url = ? AND expires_at > ?",
+                    (key, self.base_url, now)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"검색 캐시 조회 오류: {str(e)}")
+            return None
+        if row is None:
+            return None
+        return _json_loads(row[0]), row[1] - now
+    
+    def _disk_cache_put(self, key: str, result: Dict, ttl: float):
+        """검색 결과를 디스크 캐시에 저장"""
+        connection = self._get_disk_cache()
+        if connection is None:
+            return
+        now = time.time()
+        try:
+            with self._disk_cache_lock:
+                connection.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, base_url, fetched_at, expires_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, self.base_url, now, now + ttl, _json_dumps(result))
+                )
+        except sqlite3.Error as e:
+            print(f"검색 캐시 저장 오류: {str(e)}")
     
     def search_part(self, part_number: str) -> Optional[Dict]:
         """
-        파트넘버로 제품 정보 검색
+        파트넘버로 제품 정보 검색 (같은 파트넘버는 캐시에서 반환)
+        
+        조회 성공 결과는 메모리 캐시에 계속 보관하고(디스크 캐시는 DISK_CACHE_TTL 동안),
+        '검색 결과 없음'은 NEGATIVE_CACHE_TTL 동안만 보관한다. API 오류 결과는 캐시하지 않는다.
         
         Args:
             part_number: 파트넘버
@@ -308,122 +823,114 @@ class DigikeyAPIClient:
         if not self.is_configured():
             return None
         
-        try:
-            # 액세스 토큰 획득
-            token = self.get_access_token()
-            
-            # 제품 검색 API 호출 (올바른 엔드포인트)
-            search_url = f"{self.base_url}/products/v4/search/keyword"
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "X-DIGIKEY-Client-Id": self.client_id,
-                "X-DIGIKEY-Locale-Site": "US",
-                "X-DIGIKEY-Locale-Language": "en",
-                "X-DIGIKEY-Locale-Currency": "USD"
-            }
-            
-            # 검색 요청 데이터
-            payload = {
-                "Keywords": part_number,
-                "RecordCount": 1,
-                "RecordStartPosition": 0
-            }
+        key = self._search_cache_key(part_number)
+        cached, version = self._search_cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._fetch_part(part_number)
+        self._search_cache_put(key, version, result)
+        return result
+    
+    def _search_cache_get(self, key: str) -> tuple:
+        """
+        검색 캐시 조회
+        
+        Returns:
+            tuple: (캐시된 결과 복사본 또는 None, 현재 캐시 버전)
+        """
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is not None:
+                cached, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._search_cache.move_to_end(key)
+                    return dict(cached), self._search_cache_version
+                del self._search_cache[key]
+            version = self._search_cache_version
+        
+        # 메모리에 없으면 디스크 캐시 확인 (찾으면 메모리 캐시에도 보관)
+        disk_entry = self._disk_cache_get(key)
+        if disk_entry is None:
+            return None, version
+        cached, remaining = disk_entry
+        negative = cached.get("Manufacturer") == "검색 결과 없음"
+        self._memory_cache_put(key, version, cached, time.monotonic() + remaining if negative else None)
+        return dict(cached), version
+    
+    def _search_cache_put(self, key: str, version: int, result: Dict):
+        """검색 결과를 캐시에 저장 (오류 결과 제외, 조회 중 캐시가 비워졌으면 저장하지 않음)"""
+        manufacturer = result.get("Manufacturer")
+        if manufacturer in ("API 오류", "오류 발생"):
+            return
+        if manufacturer == "검색 결과 없음":
+            expires_at = time.monotonic() + self.NEGATIVE_CACHE_TTL
+            disk_ttl = self.NEGATIVE_CACHE_TTL
+        else:
+            expires_at = None
+            disk_ttl = self.DISK_CACHE_TTL
+        if self._memory_cache_put(key, version, result, expires_at):
+            self._disk_cache_put(key, result, disk_ttl)
+    
+    def _memory_cache_put(self, key: str, version: int, result: Dict, expires_at: Optional[float]) -> bool:
+        """
+        결과를 메모리 캐시에 저장
+        
+        Returns:
+            bool: 저장 여부 (조회 중 캐시가 비워졌으면 False)
+        """
+        with self._search_cache_lock:
+            if version != self._search_cache_version:
+                return False
+            self._search_cache[key] = (dict(result), expires_at)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+            return True
+    
+    def _fetch_part(self, part_number: str) -> Dict:
+        """
+        파트넘버로 제품 정보 검색 (API 호출, 캐시 미사용)
+        
+        Args:
+            part_number: 파트넘버
             
-            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
+        Returns:
+            dict: 제품 정보 (Manufacturer, MountingType 등 포함)
+        """
+        try:
+            # 검색 요청 데이터 (첫 번째 제품만 사용하므로 1건만 요청)
+            payload = self._search_payload(part_number, 1)
             
-            # 401 오류 발생 시 토큰 갱신 후 재시도
-            if response.status_code == 401:
-                try:
-                    error_data = response.json()
-                    if "expired" in error_data.get("detail", "").lower() or "Bearer token is expired" in error_data.get("detail", ""):
-                        # 토큰 만료 시 refresh_token으로 갱신 시도
-                        if self.refresh_token:
-                            print(f"토큰 만료 감지, refresh_token으로 갱신 시도...")
-                            self.refresh_access_token()
-                            # 새 토큰으로 재시도
-                            token = self.get_access_token()
-                            headers["Authorization"] = f"Bearer {token}"
-                            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
-                        else:
-                            # refresh_token이 없으면 새 토큰 요청
-                            print(f"refresh_token 없음, 새 토큰 요청...")
-                            self.access_token = None
-                            self.token_expires_at = None
-                            token = self.get_access_token()
-                            headers["Authorization"] = f"Bearer {token}"
-                            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
-                except Exception as refresh_error:
-                    print(f"토큰 갱신 실패: {str(refresh_error)}")
-                    # 갱신 실패 시 원래 오류 메시지 반환
-                    error_msg = f"API 호출 실패 (상태 코드: 401 - 토큰 만료)"
-                    try:
-                        error_data = response.json()
-                        error_msg += f"\n오류: {error_data.get('detail', error_data)}"
-                    except:
-                        error_msg += f"\n응답: {response.text[:200]}"
-                    raise Exception(error_msg)
+            response = self._post_search(payload)
             
             # 응답 상태 확인
             if response.status_code != 200:
                 error_msg = f"API 호출 실패 (상태 코드: {response.status_code})"
-                
-                # 429 오류 (일일 호출 제한 초과) 특별 처리
-                if response.status_code == 429:
-                    retry_after = response.headers.get('Retry-After', '알 수 없음')
-                    try:
-                        error_data = response.json()
-                        detail = error_data.get('detail', '')
-                        error_msg = f"API 일일 호출 제한 초과 (429 Too Many Requests)\n"
-                        error_msg += f"상세: {detail}\n"
-                        error_msg += f"재시도 가능 시간: {retry_after}초 후"
-                    except:
-                        error_msg += f"\n응답: {response.text[:200]}"
-                        error_msg += f"\n재시도 가능 시간: {retry_after}초 후"
-                    
-                    # RateLimitExceeded 예외 발생 (조회 중단을 위해)
-                    try:
-                        retry_after_int = int(retry_after) if retry_after != '알 수 없음' else None
-                    except:
-                        retry_after_int = None
-                    raise RateLimitExceeded(error_msg, retry_after_int)
-                else:
-                    try:
-                        error_data = response.json()
-                        error_msg += f"\n오류: {error_data}"
-                    except:
-                        error_msg += f"\n응답: {response.text[:200]}"
+                try:
+                    error_data = response.json()
+                    error_msg += f"\n오류: {error_data}"
+                except:
+                    error_msg += f"\n응답: {response.text[:200]}"
                 
                 raise Exception(error_msg)
             
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             # 디버깅: 응답 구조 확인
             # print(f"API 응답 구조: {list(data.keys())}")  # 필요시 주석 해제
             
             # 검색 결과가 있는 경우 (다양한 응답 구조 대응)
-            search_results = None
-            if "SearchResults" in data:
-                search_results = data["SearchResults"]
-            elif "Products" in data:
-                search_results = data["Products"]
-            elif isinstance(data, list):
-                search_results = data
+            search_results = self._extract_search_results(data)
             
             if search_results and len(search_results) > 0:
                 return self._product_to_result(search_results[0], part_number)
             else:
                 # 검색 결과가 없는 경우
-                return {
-                    "PartNumber": part_number,
-                    "Manufacturer": "검색 결과 없음",
-                    "MountingType": "N/A",
-                    "Description": "파트넘버를 찾을 수 없습니다."
-                }
+                return _result_from_template(_NOT_FOUND_TEMPLATE, part_number)
                 
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             # API 오류 발생 시
             error_msg = str(e)
             if hasattr(e, 'response') and e.response is not None:
@@ -434,21 +941,237 @@ class DigikeyAPIClient:
                     error_msg = f"{error_msg}\n응답: {e.response.text[:200]}"
             
             print(f"파트넘버 조회 오류 ({part_number}): {error_msg}")
-            return {
-                "PartNumber": part_number,
-                "Manufacturer": "API 오류",
-                "MountingType": "N/A",
-                "Error": error_msg
-            }
+            return _result_from_template(_API_ERROR_TEMPLATE, part_number, error_msg)
+        except RateLimitExceeded:
+            # 재시도 후에도 한도 초과인 경우 호출자가 조회를 중단할 수 있도록 전달
+            raise
         except Exception as e:
             # 기타 오류
             print(f"파트넘버 조회 오류 ({part_number}): {str(e)}")
-            return {
-                "PartNumber": part_number,
-                "Manufacturer": "오류 발생",
-                "MountingType": "N/A",
-                "Error": str(e)
-            }
+            return _result_from_template(_ERROR_TEMPLATE, part_number, str(e))
+    
+    def search_parts_bulk(self, part_numbers: List[str], max_workers: int = 8,
+                          executor: Optional[Executor] = None) -> List[Dict]:
+        """
+        여러 파트넘버를 동시에 검색 (스레드 풀 사용)
+        
+        Args:
+            part_numbers: 파트넘버 목록
+            max_workers: 동시 요청 수 (executor를 지정하지 않은 경우에만 사용)
+            executor: 재사용할 Executor (여러 묶음을 나누어 조회할 때 풀 재생성 방지)
+            
+        Returns:
+            list: 입력 순서와 같은 순서의 검색 결과 목록
+            
+        Raises:
+            RateLimitExceeded: 호출 한도 초과 시 (대기 중인 요청은 취소됨)
+        """
+        if not part_numbers:
+            return []
+        
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        
+        results = [None] * len(part_numbers)
+        futures = {executor.submit(self.search_part, pn): i for i, pn in enumerate(part_numbers)}
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except RateLimitExceeded:
+            # 한도 초과 시 아직 시작하지 않은 요청은 취소
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+        
+        return results
+    
+    @staticmethod
+    def _require_aiohttp():
+        """aiohttp가 설치되어 있지 않으면 설치 안내 예외 발생"""
+        if aiohttp is None:
+            raise Exception("비동기 검색을 사용하려면 aiohttp 패키지를 설치하세요. (pip install aiohttp)")
+    
+    def _has_aio_session(self) -> bool:
+        """현재 이벤트 루프에서 사용할 수 있는 aiohttp 세션이 있는지 확인"""
+        return (
+            self._aio_session is not None
+            and not self._aio_session.closed
+            and self._aio_loop is asyncio.get_running_loop()
+        )
+    
+    def _get_aio_session(self):
+        """현재 이벤트 루프에서 사용할 aiohttp 세션 반환 (없거나 다른 루프의 세션이면 새로 생성)"""
+        self._require_aiohttp()
+        if not self._has_aio_session():
+            loop = asyncio.get_running_loop()
+            connector = aiohttp.TCPConnector(limit=64)
+            self._aio_session = aiohttp.ClientSession(connector=connector)
+            self._aio_loop = loop
+        return self._aio_session
+    
+    async def _aget_valid_token(self) -> str:
+        """유효한 액세스 토큰 반환 (비동기 버전, 갱신이 필요할 때만 스레드에서 처리)"""
+        if self._token_is_valid():
+            return self.access_token
+        return await asyncio.to_thread(self._get_valid_token)
+    
+    async def _arequest_with_retry(self, method: str, url: str, **kwargs) -> tuple:
+        """
+        _request_with_retry의 비동기 버전 (aiohttp 사용)
+        
+        Returns:
+            tuple: (마지막 응답, 응답 본문 bytes)
+        """
+        session = self._get_aio_session()
+        delay = self.RETRY_BASE_DELAY
+        for attempt in range(self.max_retries + 1):
+            await self._limiter.acquire_async()
+            async with session.request(method, url, **kwargs) as response:
+                body = await response.read()
+            if response.status == 429:
+                self._limiter.decrease()
+            elif response.status < 400:
+                self._limiter.increase()
+            if response.status not in self.RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response, body
+            
+            retry_after = self._parse_retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.RETRY_MAX_DELAY:
+                    return response, body
+                await asyncio.sleep(retry_after)
+            else:
+                delay = min(self.RETRY_MAX_DELAY, random.uniform(self.RETRY_BASE_DELAY, delay * 3))
+                await asyncio.sleep(delay)
+        return response, body
+    
+    async def _apost_search(self, payload: dict, timeout: int = 30) -> tuple:
+        """
+        _post_search의 비동기 버전 (aiohttp 사용)
+        
+        Returns:
+            tuple: (검색 응답, 응답 본문 bytes)
+            
+        Raises:
+            RateLimitExceeded: 재시도 후에도 호출 한도 초과인 경우
+        """
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        headers = self._search_headers(await self._aget_valid_token())
+        response, body = await self._arequest_with_retry(
+            "POST", self.search_url, headers=headers, json=payload, timeout=client_timeout
+        )
+        if response.status == 401:
+            self.invalidate_token()
+            headers = self._search_headers(await self._aget_valid_token())
+            response, body = await self._arequest_with_retry(
+                "POST", self.search_url, headers=headers, json=payload, timeout=client_timeout
+            )
+        if response.status == 429:
+            raise self._rate_limit_exceeded(response, body)
+        return response, body
+    
+    async def asearch_part(self, part_number: str) -> Optional[Dict]:
+        """
+        파트넘버로 제품 정보 검색 (비동기 버전, aiohttp 필요)
+        
+        캐시, 토큰 관리, 재시도, 속도 제한은 search_part와 공유한다.
+        
+        Args:
+            part_number: 파트넘버
+            
+        Returns:
+            dict: 제품 정보 (Manufacturer, MountingType 등 포함)
+        """
+        self._require_aiohttp()
+        if not self.is_configured():
+            return None
+        
+        key = self._search_cache_key(part_number)
+        cached, version = self._search_cache_get(key)
+        if cached is not None:
+            return cached
+        
+        result = await self._afetch_part(part_number)
+        self._search_cache_put(key, version, result)
+        return result
+    
+    async def _afetch_part(self, part_number: str) -> Dict:
+        """
+        파트넘버로 제품 정보 검색 (비동기 API 호출, 캐시 미사용)
+        
+        Args:
+            part_number: 파트넘버
+            
+        Returns:
+            dict: 제품 정보 (Manufacturer, MountingType 등 포함)
+        """
+        try:
+            payload = self._search_payload(part_number, 1)
+            response, body = await self._apost_search(payload)
+            
+            if response.status != 200:
+                raise Exception(
+                    f"API 호출 실패 (상태 코드: {response.status})\n"
+                    f"응답: {body[:200].decode('utf-8', 'replace')}"
+                )
+            
+            search_results = self._extract_search_results(_json_loads(body))
+            if search_results and len(search_results) > 0:
+                return self._product_to_result(search_results[0], part_number)
+            return _result_from_template(_NOT_FOUND_TEMPLATE, part_number)
+        except RateLimitExceeded:
+            raise
+        except _AIO_ERRORS as e:
+            print(f"파트넘버 조회 오류 ({part_number}): {str(e)}")
+            return _result_from_template(_API_ERROR_TEMPLATE, part_number, str(e))
+        except Exception as e:
+            print(f"파트넘버 조회 오류 ({part_number}): {str(e)}")
+            return _result_from_template(_ERROR_TEMPLATE, part_number, str(e))
+    
+    async def asearch_parts_bulk(self, part_numbers: List[str], concurrency: int = 32) -> List[Dict]:
+        """
+        여러 파트넘버를 하나의 이벤트 루프에서 동시에 검색 (aiohttp 필요)
+        
+        스레드를 요청마다 쓰지 않으므로 search_parts_bulk보다 많은 요청을 동시에
+        유지할 수 있다. 실제 전송 속도는 qps_limit로 제한된다.
+        
+        Args:
+            part_numbers: 파트넘버 목록
+            concurrency: 동시에 진행할 최대 요청 수
+            
+        Returns:
+            list: 입력 순서와 같은 순서의 검색 결과 목록
+            
+        Raises:
+            RateLimitExceeded: 호출 한도 초과 시 (남은 요청은 취소됨)
+        """
+        self._require_aiohttp()
+        if not part_numbers:
+            return []
+        
+        # 이 호출에서 세션을 새로 만든 경우(asyncio.run 등 일회성 루프) 끝날 때 닫음
+        owns_session = not self._has_aio_session()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def search_one(pn):
+            async with semaphore:
+                return await self.asearch_part(pn)
+        
+        tasks = [asyncio.ensure_future(search_one(pn)) for pn in part_numbers]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except RateLimitExceeded:
+            # 한도 초과 시 남은 요청은 취소
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            if owns_session:
+                await self.aclose()
     
     def search_part_multiple(self, part_number: str, record_count: int = 15) -> List[Dict]:
         """
@@ -464,56 +1187,12 @@ class DigikeyAPIClient:
         if not self.is_configured():
             return []
         try:
-            token = self.get_access_token()
-            search_url = f"{self.base_url}/products/v4/search/keyword"
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "X-DIGIKEY-Client-Id": self.client_id,
-                "X-DIGIKEY-Locale-Site": "US",
-                "X-DIGIKEY-Locale-Language": "en",
-                "X-DIGIKEY-Locale-Currency": "USD"
-            }
-            payload = {
-                "Keywords": part_number,
-                "RecordCount": min(record_count, 50),
-                "RecordStartPosition": 0
-            }
-            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
-            if response.status_code == 401:
-                try:
-                    error_data = response.json()
-                    if "expired" in error_data.get("detail", "").lower() or "Bearer token is expired" in error_data.get("detail", ""):
-                        if self.refresh_token:
-                            self.refresh_access_token()
-                            token = self.get_access_token()
-                            headers["Authorization"] = f"Bearer {token}"
-                            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
-                        else:
-                            self.access_token = None
-                            self.token_expires_at = None
-                            token = self.get_access_token()
-                            headers["Authorization"] = f"Bearer {token}"
-                            response = requests.post(search_url, headers=headers, json=payload, timeout=30)
-                except Exception:
-                    return []
-            if response.status_code == 429:
-                try:
-                    retry_after = response.headers.get("Retry-After", "알 수 없음")
-                    retry_after_int = int(retry_after) if retry_after != "알 수 없음" else None
-                except Exception:
-                    retry_after_int = None
-                raise RateLimitExceeded("API 일일 호출 제한 초과", retry_after_int)
+            payload = self._search_payload(part_number, record_count)
+            response = self._post_search(payload)
             if response.status_code != 200:
                 return []
-            data = response.json()
-            search_results = None
-            if "SearchResults" in data:
-                search_results = data["SearchResults"]
-            elif "Products" in data:
-                search_results = data["Products"]
-            elif isinstance(data, list):
-                search_results = data
+            data = _json_loads(response.content)
+            search_results = self._extract_search_results(data)
             if not search_results or len(search_results) == 0:
                 return []
             results = []
@@ -4,16 +4,163 @@
 """
 
 import pandas as pd
+import codecs
+import hashlib
 import os
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# python-calamine이 설치되어 있으면 calamine 엔진으로 읽기 (openpyxl보다 여러 배 빠르고 메모리 사용이 적음, 선택 사항)
+# pandas 2.2 이상에서만 지원하며, 지원하지 않거나 calamine이 읽지 못하는 파일은 기본 엔진으로 다시 읽음
+try:
+    import python_calamine  # noqa: F401 (설치 여부 확인용)
+    _CALAMINE_ENGINE = "calamine"
+except ImportError:
+    _CALAMINE_ENGINE = None
+
+# 읽은 시트를 (파일 경로, 수정 시각, 크기, 시트 이름, 읽기 옵션) 기준으로 보관할 최대 개수 (LRU)
+# 파일이 바뀌지 않았으면 시트를 다시 선택하거나 같은 파일을 다시 열 때 파싱하지 않음
+SHEET_CACHE_SIZE = 16
+_sheet_cache = OrderedDict()
+
+# 디스크 시트 캐시(sheet_cache_dir)에서 이 기간(일) 동안 사용하지 않은 파일은 정리
+SHEET_DISK_CACHE_KEEP_DAYS = 30
+
+# 고유 값 비율이 이보다 낮은 문자열 컬럼은 category로 변환 (같은 문자열을 셀마다 따로 보관하지 않음)
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# load_file_async/load_sheet_async용 작업 스레드 (1개 - 파일/시트 로드와 캐시 갱신이 동시에 실행되지 않음)
+_load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel-load")
+
+
+def _open_excel_file(file_path, engine=_CALAMINE_ENGINE):
+    """
+    엑셀 파일 열기 (calamine 엔진 실패 시 기본 엔진 사용)
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        engine: 먼저 시도할 엔진 (None이면 pandas 기본 엔진)
+        
+    Returns:
+        pd.ExcelFile: 열린 엑셀 파일
+    """
+    if engine is not None:
+        try:
+            return pd.ExcelFile(file_path, engine=engine)
+        except Exception:
+            pass
+    return pd.ExcelFile(file_path)
+
+
+# 시트 이름을 통합문서 ZIP의 xl/workbook.xml에서 직접 읽을 수 있는 형식
+_ZIP_WORKBOOK_SUFFIXES = ('.xlsx', '.xlsm')
+
+
+def _read_zip_sheet_names(file_path):
+    """
+    xlsx/xlsm 통합문서의 시트 이름을 xl/workbook.xml만 읽어 가져오기
+    (스타일/공유 문자열 등 통합문서 전체를 파싱하지 않음)
+    
+    Args:
+        file_path: 엑셀 파일 경로
+        
+    Returns:
+        list: 시트 이름 목록 (통합문서 순서)
+    """
+    sheet_names = []
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open('xl/workbook.xml') as workbook_xml:
+            for _, element in ET.iterparse(workbook_xml):
+                if element.tag.rpartition('}')[2] == 'sheet':
+                    sheet_names.append(element.get('name'))
+                element.clear()
+    return sheet_names
+
+# 엑셀 대신 read_csv로 읽는 텍스트 파일 (확장자 -> 구분자), 시트는 파일 이름 하나로 표시
+_CSV_SEPARATORS = {'.csv': ',', '.tsv': '\t'}
+
+# 텍스트 파일 인코딩 확인에 읽을 앞부분 크기(바이트)
+_CSV_ENCODING_SAMPLE_SIZE = 1 << 16
+
+
+def _csv_encoding(file_path):
+    """
+    텍스트 파일의 인코딩 판별 (UTF-8로 읽을 수 없으면 엑셀에서 저장한 한글 CSV의 cp949로 간주)
+    
+    Args:
+        file_path: 파일 경로
+        
+    Returns:
+        str: read_csv에 전달할 인코딩
+    """
+    with open(file_path, 'rb') as f:
+        sample = f.read(_CSV_ENCODING_SAMPLE_SIZE)
+    try:
+        # 앞부분만 읽었으므로 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8-sig'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def _compact_string_columns(df):
+    """
+    반복 값이 많은 문자열(object) 컬럼을 category로 변환하여 메모리 사용 줄이기 (값과 표시는 그대로)
+    
+    Args:
+        df: 시트 데이터 (직접 변경)
+        
+    Returns:
+        pandas DataFrame: 변환한 시트 데이터
+    """
+    row_count = len(df)
+    if row_count == 0:
+        return df
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if df[col].nunique() / row_count < CATEGORY_MAX_UNIQUE_RATIO:
+            df[col] = df[col].astype('category')
+    return df
+
+
+def _remember_sheet(cache_key, df):
+    """
+    읽은 시트를 메모리 캐시에 저장 (가장 오래 사용하지 않은 시트부터 제거)
+    
+    Args:
+        cache_key: load_sheet의 캐시 키
+        df: 시트 데이터
+    """
+    _sheet_cache[cache_key] = df
+    _sheet_cache.move_to_end(cache_key)
+    if len(_sheet_cache) > SHEET_CACHE_SIZE:
+        _sheet_cache.popitem(last=False)
 
 
 class ExcelHandler:
     """엑셀 파일 처리 클래스"""
     
-    def __init__(self):
+    def __init__(self, sheet_cache_dir: str = None):
+        """
+        초기화
+        
+        Args:
+            sheet_cache_dir: 읽은 시트를 저장해 둘 디렉터리 (None이면 메모리 캐시만 사용)
+                             - 프로그램을 다시 시작해도 바뀌지 않은 파일은 엑셀 파싱 없이 읽음
+                             - 저장 파일은 pickle이므로 읽을 때 그 안의 코드가 실행될 수 있음.
+                               사용자 본인만 쓸 수 있는 디렉터리를 지정하고 공유 폴더는 사용하지 말 것
+        """
+        self.sheet_cache_dir = sheet_cache_dir
         self.file_path = None
         self.current_sheet = None
         self.sheet_names = []
+        self._csv_sep = None  # CSV/TSV 파일이면 구분자 (엑셀 대신 read_csv로 읽음)
+        self._excel_file = None  # load_file에서 연 엑셀 파일 (첫 시트 로드에 재사용 후 닫음, xlsx/xlsm은 시트를 읽을 때 엶)
+        if sheet_cache_dir:
+            self._prune_disk_cache()
     
     def load_file(self, file_path):
         """
@@ -26,11 +173,30 @@ class ExcelHandler:
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
         self.file_path = file_path
+        self.close()
+        
+        # CSV/TSV는 시트가 하나뿐이므로 파일을 열지 않고 파일 이름을 시트 이름으로 사용
+        stem, ext = os.path.splitext(os.path.basename(file_path))
+        self._csv_sep = _CSV_SEPARATORS.get(ext.lower())
+        if self._csv_sep is not None:
+            self.sheet_names = [stem]
+            return
         
         # 엑셀 파일의 모든 시트 이름 가져오기
+        # xlsx/xlsm은 ZIP 안의 workbook.xml만 읽음 (캐시된 시트를 다시 고르면 통합문서를 열지 않음)
+        if file_path.lower().endswith(_ZIP_WORKBOOK_SUFFIXES):
+            try:
+                self.sheet_names = _read_zip_sheet_names(file_path)
+                if self.sheet_names:
+                    return
+            except (zipfile.BadZipFile, KeyError, ET.ParseError):
+                pass
+        
+        # 그 외 형식(xls/ods) 또는 ZIP에서 읽지 못한 경우 pandas로 열기
+        # (calamine이 없으면 xlsx/xlsm은 openpyxl 읽기 전용 모드로 열려 셀 데이터는 시트를 읽을 때 스트리밍됨)
         try:
-            excel_file = pd.ExcelFile(file_path)
-            self.sheet_names = excel_file.sheet_names
+            self._excel_file = _open_excel_file(file_path)
+            self.sheet_names = self._excel_file.sheet_names
         except Exception as e:
             raise Exception(f"엑셀 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
     
@@ -38,12 +204,15 @@ class ExcelHandler:
         """사용 가능한 시트 이름 목록 반환"""
         return self.sheet_names.copy()
     
-    def load_sheet(self, sheet_name):
+    def load_sheet(self, sheet_name, usecols=None, nrows=None, skiprows=None):
         """
         지정된 시트를 로드
         
         Args:
             sheet_name: 시트 이름
+            usecols: 읽을 컬럼 (pandas read_excel과 같은 형식, None이면 전체 - 지정한 컬럼만 메모리에 올림)
+            nrows: 읽을 최대 행 수 (None이면 전체 - 미리보기처럼 앞부분만 필요할 때 나머지 행을 파싱하지 않음)
+            skiprows: 건너뛸 행 (행 수 또는 행 번호 목록, pandas read_excel과 같은 형식)
             
         Returns:
             pandas DataFrame: 시트 데이터
@@ -54,13 +223,209 @@ class ExcelHandler:
         if sheet_name not in self.sheet_names:
             raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
         
+        options = {'usecols': usecols, 'nrows': nrows, 'skiprows': skiprows}
+        options_key = tuple(
+            tuple(value) if isinstance(value, (list, tuple, set, range)) else value
+            for value in options.values()
+        )
+        
         try:
-            df = pd.read_excel(self.file_path, sheet_name=sheet_name)
+            stat = os.stat(self.file_path)
+            cache_key = (os.path.abspath(self.file_path), stat.st_mtime_ns, stat.st_size, sheet_name, options_key)
+        except OSError:
+            cache_key = None
+        if callable(usecols) or callable(skiprows):
+            # 함수로 지정한 조건은 같은 조건인지 비교할 수 없으므로 캐시하지 않음
+            cache_key = None
+        
+        cached = _sheet_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            _sheet_cache.move_to_end(cache_key)
+        elif cache_key is not None:
+            # 이전 실행에서 저장해 둔 시트가 있으면 엑셀을 파싱하지 않고 사용
+            cached = self._disk_cache_get(cache_key)
+            if cached is not None:
+                _remember_sheet(cache_key, cached)
+        if cached is not None:
+            self.current_sheet = sheet_name
+            self.close()
+            # 호출한 쪽에서 수정해도 캐시된 데이터는 바뀌지 않도록 복사본 반환
+            return cached.copy()
+        
+        try:
+            if self._csv_sep is not None:
+                df = pd.read_csv(self.file_path, sep=self._csv_sep, encoding=_csv_encoding(self.file_path), **options)
+            else:
+                df = self._parse_excel_sheet(sheet_name, options)
             self.current_sheet = sheet_name
+            df = _compact_string_columns(df)
+            if cache_key is not None:
+                _remember_sheet(cache_key, df)
+                self._disk_cache_put(cache_key, df)
+                return df.copy()
             return df
         except Exception as e:
             raise Exception(f"시트를 로드하는 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            # 시트를 읽은 뒤에는 파일을 닫아 엑셀에서 같은 파일을 저장할 수 있게 함
+            self.close()
+    
+    def _parse_excel_sheet(self, sheet_name, options):
+        """
+        엑셀 시트 파싱 (calamine 엔진 실패 시 기본 엔진으로 다시 읽음)
+        
+        Args:
+            sheet_name: 시트 이름
+            options: parse에 전달할 옵션
+            
+        Returns:
+            pandas DataFrame: 시트 데이터
+        """
+        # load_file에서 열어 둔 파일을 재사용 (공유 문자열 등 통합문서 전체 파싱을 반복하지 않음)
+        if self._excel_file is None:
+            self._excel_file = _open_excel_file(self.file_path)
+        try:
+            return self._excel_file.parse(sheet_name, **options)
+        except Exception:
+            if self._excel_file.engine != "calamine":
+                raise
+            # calamine이 읽지 못하는 시트는 기본 엔진으로 다시 읽음
+            self.close()
+            self._excel_file = _open_excel_file(self.file_path, engine=None)
+            return self._excel_file.parse(sheet_name, **options)
+    
+    def load_file_async(self, file_path):
+        """
+        load_file을 작업 스레드에서 실행 (xls 등 통합문서를 열어야 하는 형식에서도 UI가 멈추지 않음)
+        
+        Args:
+            file_path: 엑셀 파일 경로
+            
+        Returns:
+            concurrent.futures.Future: 완료 후 결과는 시트 이름 목록
+        """
+        def load():
+            self.load_file(file_path)
+            return self.get_sheet_names()
+        
+        return _load_executor.submit(load)
+    
+    def load_sheet_async(self, sheet_name, prepare=None, **options):
+        """
+        load_sheet을 작업 스레드에서 실행 (파싱 중에도 UI가 멈추지 않음)
+        
+        Args:
+            sheet_name: 시트 이름
+            prepare: 로드한 DataFrame을 받아 작업 스레드에서 함께 실행할 함수 (선택적, 표시용 변환 등)
+            **options: load_sheet에 전달할 옵션 (usecols, nrows, skiprows)
+            
+        Returns:
+            concurrent.futures.Future: 결과는 DataFrame 또는 prepare의 반환값 (실행 전이면 Future.cancel()로 취소 가능)
+        """
+        if prepare is None:
+            return _load_executor.submit(self.load_sheet, sheet_name, **options)
+        return _load_executor.submit(lambda: prepare(self.load_sheet(sheet_name, **options)))
     
     def file_loaded(self):
         """파일이 로드되었는지 확인"""
         return self.file_path is not None and len(self.sheet_names) > 0
+    
+    def _disk_cache_path(self, cache_key):
+        """
+        디스크 캐시 파일 경로 (같은 시트의 이전 버전 파일은 앞부분이 같음)
+        
+        Args:
+            cache_key: load_sheet의 캐시 키
+            
+        Returns:
+            tuple: (파일 이름 앞부분, 파일 경로)
+        """
+        file_path, mtime_ns, size, sheet_name, options_key = cache_key
+        prefix = hashlib.sha1(repr((file_path, sheet_name, options_key)).encode('utf-8')).hexdigest()
+        return prefix, os.path.join(self.sheet_cache_dir, f"{prefix}_{mtime_ns}_{size}.pkl")
+    
+    def _disk_cache_get(self, cache_key):
+        """
+        디스크 캐시에서 시트 읽기
+        
+        Args:
+            cache_key: load_sheet의 캐시 키
+            
+        Returns:
+            pandas DataFrame 또는 None (저장된 시트가 없거나 읽을 수 없는 경우)
+        """
+        if not self.sheet_cache_dir:
+            return None
+        _, path = self._disk_cache_path(cache_key)
+        try:
+            df = pd.read_pickle(path)
+            os.utime(path)  # 최근 사용 시각 갱신 (정리 대상에서 제외)
+            return df
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"시트 캐시 파일 읽기 오류: {str(e)}")
+            return None
+    
+    def _disk_cache_put(self, cache_key, df):
+        """
+        시트를 디스크 캐시에 저장 (별도 스레드에서 기록하여 시트 로드를 기다리게 하지 않음)
+        
+        Args:
+            cache_key: load_sheet의 캐시 키
+            df: 시트 데이터 (메모리 캐시에 보관되어 변경되지 않는 객체)
+        """
+        if not self.sheet_cache_dir:
+            return
+        cache_dir = self.sheet_cache_dir
+        prefix, path = self._disk_cache_path(cache_key)
+        
+        def write():
+            try:
+                os.makedirs(cache_dir, mode=0o700, exist_ok=True)  # 다른 사용자가 캐시 파일을 넣지 못하게 함 (POSIX)
+                # 임시 파일에 다 쓴 뒤 교체 (기록 중 종료되어도 잘린 파일을 읽지 않음)
+                temp_path = f"{path}.tmp"
+                df.to_pickle(temp_path)
+                os.replace(temp_path, path)
+                # 같은 시트의 이전 버전(파일 수정 전) 삭제
+                for name in os.listdir(cache_dir):
+                    if name.startswith(f"{prefix}_") and os.path.join(cache_dir, name) != path:
+                        os.remove(os.path.join(cache_dir, name))
+            except Exception as e:
+                print(f"시트 캐시 파일 저장 오류: {str(e)}")
+        
+        threading.Thread(target=write, name="sheet-cache-write", daemon=True).start()
+    
+    def _prune_disk_cache(self):
+        """디스크 캐시에서 SHEET_DISK_CACHE_KEEP_DAYS 동안 사용하지 않은 파일 삭제"""
+        expire_before = time.time() - SHEET_DISK_CACHE_KEEP_DAYS * 86400
+        try:
+            with os.scandir(self.sheet_cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < expire_before:
+                        os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"시트 캐시 정리 오류: {str(e)}")
+    
+    def clear_cache(self):
+        """읽어 둔 시트 캐시 비우기 (파일을 강제로 다시 읽을 때 사용, 디스크 캐시 포함)"""
+        _sheet_cache.clear()
+        if not self.sheet_cache_dir:
+            return
+        try:
+            with os.scandir(self.sheet_cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.pkl'):
+                        os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"시트 캐시 삭제 오류: {str(e)}")
+    
+    def close(self):
+        """열어 둔 엑셀 파일 닫기"""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
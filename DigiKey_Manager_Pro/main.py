@@ -5,19 +5,162 @@
 """
 
 import difflib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import pandas as pd
 import os
+import queue
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
 import webbrowser
+from urllib.parse import quote_plus
 from excel_handler import ExcelHandler
 from digikey_api import DigikeyAPIClient, RateLimitExceeded
 from database import PartDatabase
 
+# rapidfuzz가 설치되어 있으면 유사도 계산에 사용 (difflib보다 수십 배 빠름, 선택 사항)
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
 # 유사 자재: 최소 유사도(0~1), 목록 최대 개수
 SIMILAR_PARTS_MIN_RATIO = 0.6
 SIMILAR_PARTS_MAX_COUNT = 10
 
+# 조회 실패로 판단하는 Manufacturer 값과 오류 필드 이름
+# (DB에서 읽은 결과에는 오류 필드가 없으므로 Manufacturer 값은 DB와 같은 목록 사용)
+_QUERY_FAILED_MANUFACTURERS = frozenset(PartDatabase.FAILED_MANUFACTURERS)
+_QUERY_ERROR_KEYS = frozenset({'Error', 'error'})
+
+# 파트넘버 정리 시 제거할 문자 (줄바꿈, 탭)
+_PART_NUMBER_STRIP_TABLE = str.maketrans('', '', '\n\r\t')
+
+# 상세정보에서 별도로 표시하므로 '기타 정보' 목록에서 제외하는 FullData 항목
+_DETAIL_SHOWN_KEYS = frozenset(
+    ('Manufacturer', 'MountingType', 'ProductUrl', 'DatasheetUrl', 'Source', 'CreatedAt', 'UpdatedAt')
+)
+
+# 연속 조회 중 진행 상황 창을 갱신하는 최소 간격(초) - DB에서 바로 찾는 행이 많을 때 화면 갱신 부담을 줄임
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+# 연속 조회 전에 DB에 없는 파트넘버를 API로 미리 동시 조회 (속도는 API 클라이언트의 토큰 버킷이 제한)
+API_PREFETCH_WORKERS = 8
+API_PREFETCH_POLL_MS = 100  # 미리 조회 중 완료 여부 확인 및 진행 상황 창 갱신 간격(밀리초)
+
+# 트리뷰에 행을 나누어 넣는 단위 (묶음마다 화면 갱신을 처리해 큰 시트에서도 창이 멈추지 않게 함)
+TREE_INSERT_CHUNK_SIZE = 2000
+
+# 시트 행 수가 이보다 많으면 화면에 보이는 행만 트리뷰에 넣음 (가상 스크롤)
+TREE_VIRTUAL_ROW_THRESHOLD = 5000
+
+# 작업 스레드에서 파일/시트를 로드하는 동안 완료 여부를 확인하는 간격(밀리초)
+SHEET_LOAD_POLL_MS = 50
+
+# API 설정 창에서 입력이 멈춘 뒤 Client Secret을 검사하기까지의 지연(밀리초)
+SECRET_VALIDATE_DELAY_MS = 200
+
+# API 설정 저장 후 결과 문구를 보여준 뒤 설정 창을 숨기기까지의 시간(밀리초)
+SETTINGS_SAVED_HIDE_MS = 1000
+
+
+def _fsync_directory(path: str):
+    """
+    파일 교체(os.replace) 결과가 디스크에 기록되도록 디렉토리를 fsync (POSIX만 해당, Windows는 무시)
+    
+    Args:
+        path: 디렉토리 경로
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _center_window(window, width: int, height: int):
+    """
+    창 크기를 지정하고 화면 중앙에 배치
+    (크기를 알고 있으므로 update_idletasks로 배치 계산을 기다리지 않고 한 번에 설정)
+    
+    Args:
+        window: 배치할 창
+        width: 창 너비
+        height: 창 높이
+    """
+    x = (window.winfo_screenwidth() - width) // 2
+    y = (window.winfo_screenheight() - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _parse_config(path):
+    """
+    config 파일을 한 번에 읽어 '키=값' 줄을 딕셔너리로 변환
+    
+    빈 줄과 '#'으로 시작하는 줄은 무시하며, 같은 키가 여러 번 있으면 첫 번째 값만 사용
+    
+    Args:
+        path: config 파일 경로
+        
+    Returns:
+        {키: 값} 딕셔너리 (키와 값은 앞뒤 공백 제거)
+    """
+    config_data = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    for key, value in (line.split('=', 1) for line in map(str.strip, lines)
+                       if '=' in line and not line.startswith('#')):
+        config_data.setdefault(key.strip(), value.strip())
+    return config_data
+
+
+# 파트넘버 컬럼 이름 패턴 (소문자 컬럼 이름에 적용, 앞의 패턴이 우선)
+# 각 패턴 끝의 빈 그룹 번호(match.lastindex)가 우선순위가 됨
+_PART_COLUMN_RE = re.compile(
+    r"^(?:"
+    r"(?=.*part)(?=.*number)()"  # 정확한 매칭 (Part Number, Part_Number 포함)
+    r"|(?=.*파트)(?=.*넘버)()"  # 파트넘버 (한글)
+    r"|(?=.*파트)(?=.*번호)()"
+    r"|part\Z()"  # Part만 포함
+    r"|partno\Z()"
+    r"|part_no\Z()"
+    r"|number\Z()"  # Number만 포함 (일부 경우)
+    r")",
+    re.DOTALL
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _find_part_number_column_cached(columns):
+    """
+    컬럼 이름 목록에서 파트넘버 컬럼 찾기 (컬럼 구성별로 결과 캐시)
+    
+    Args:
+        columns: 컬럼 이름 튜플
+        
+    Returns:
+        파트넘버 컬럼 이름 또는 None
+    """
+    best_rank = best_column = None
+    for col in columns:
+        match = _PART_COLUMN_RE.match(str(col).lower())
+        # 컬럼마다 정규식 한 번으로 가장 우선순위가 높은 패턴 번호를 얻음 (같은 순위면 앞 컬럼 우선)
+        if match and (best_rank is None or match.lastindex < best_rank):
+            best_rank, best_column = match.lastindex, col
+            if best_rank == 1:
+                break
+    
+    return best_column
+
 
 class DigikeyViewerApp:
     """메인 애플리케이션 클래스"""
@@ -27,16 +170,42 @@ class DigikeyViewerApp:
         self.root.title("디지키 파트넘버 조회 프로그램 v1.2.6")
         self.root.geometry("1200x700")
         
+        # 여러 창에서 반복 사용하는 글꼴 (위젯마다 글꼴 지정 문자열을 해석하지 않도록 한 번만 생성하여 공유)
+        self.font_title = tkfont.Font(family="Arial", size=12, weight="bold")
+        self.font_heading = tkfont.Font(family="Arial", size=10, weight="bold")
+        self.font_small = tkfont.Font(family="Arial", size=9)
+        self.font_note = tkfont.Font(family="Arial", size=8)
+        
         # API 일일 호출 제한 (디지키 Product Information API)
         self.api_daily_limit = 1000
         
         # 데이터 저장 변수
-        self.excel_handler = ExcelHandler()
-        self.digikey_api = DigikeyAPIClient()
         self.part_db = PartDatabase()  # 파트넘버 데이터베이스
+        # 읽은 시트를 디스크에도 저장 (다음 실행에서 재사용) - 작업 디렉터리와 관계없이 DB 파일과 같은 위치의 sheet_cache 폴더 사용
+        self.excel_handler = ExcelHandler(
+            sheet_cache_dir=os.path.join(os.path.dirname(os.path.abspath(self.part_db.db_path)), "sheet_cache")
+        )
+        self.digikey_api = DigikeyAPIClient()
         self.current_df = None  # 현재 로드된 엑셀 데이터
+        self._current_values = None  # current_df의 object 배열 (시트를 읽은 작업 스레드에서 미리 변환, current_df와 함께 설정)
+        self._part_number_col = None  # current_df에서 찾은(또는 사용자가 선택한) 파트넘버 컬럼 - 시트를 새로 불러오면 초기화
+        self._tree1_rows = None  # 가상 스크롤 시 표시할 (인덱스, 값 배열) - None이면 모든 행을 트리뷰에 넣은 상태
+        self._tree1_offset = 0  # 가상 스크롤 시 화면 맨 위 행 위치
+        self._tree1_selected = None  # 가상 스크롤 시 선택된 행 iid (화면 밖으로 나가도 유지)
+        self._tree1_rendering = False
         self.query_results = []  # 조회 결과 저장
+        self._browser = None  # 기본 웹브라우저 컨트롤러 (_get_browser에서 처음 사용 시 설정)
+        self._detail_urls = []  # 상세정보 텍스트의 링크 (시작, 끝, URL) - 클릭 위치로 URL 판별
+        self._progress_widgets = None  # 연속 조회 진행 상황 창 (창, 개수 라벨, 상세 라벨, 진행률 바) - 재사용
+        self._progress_cancel_button = None  # 진행 상황 창의 중지 버튼
+        self._settings_widgets = None  # API 설정 창 (창, 입력값 초기화 함수) - 닫으면 숨기고 다시 열 때 재사용
+        self._query_cancelled = False  # 연속 조회 중 사용자가 중지를 요청했는지 여부
+        self._query_running = False  # 연속 조회 진행 여부 (조회 중에는 다른 행 더블클릭 무시)
+        self._close_requested = False  # 연속 조회 중 프로그램 종료 요청 여부 (조회를 중지한 뒤 종료)
+        self._open_toplevels = weakref.WeakSet()  # 열려 있는 Toplevel 창 (_new_toplevel로 생성, 종료 시 닫기)
         self.config_file = "config.txt"  # 설정 파일 경로
+        self._config_queue = queue.Queue(maxsize=1)  # config.txt 저장 대기 (아직 기록되지 않은 최신 값 하나만 유지)
+        threading.Thread(target=self._config_writer, name="config-writer", daemon=True).start()
         
         # config 파일에서 API 키 로드
         self.load_config()
@@ -127,6 +296,7 @@ class DigikeyViewerApp:
         self.tree1 = ttk.Treeview(frame, yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
         scrollbar_y.config(command=self.tree1.yview)
         scrollbar_x.config(command=self.tree1.xview)
+        self.tree1_scrollbar_y = scrollbar_y
         
         # 그리드 배치
         self.tree1.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -138,6 +308,17 @@ class DigikeyViewerApp:
         
         # 더블클릭 이벤트 바인딩
         self.tree1.bind("<Double-1>", self.on_part_double_click)
+        
+        # 가상 스크롤용 이벤트 (모든 행을 넣은 경우에는 기본 동작 사용)
+        self.tree1.bind("<Configure>", lambda e: self._render_tree1_rows())
+        self.tree1.bind("<<TreeviewSelect>>", self._on_tree1_select)
+        self.tree1.bind("<MouseWheel>", lambda e: self._scroll_tree1(-1 if e.delta > 0 else 1, 3))
+        self.tree1.bind("<Button-4>", lambda e: self._scroll_tree1(-1, 3))
+        self.tree1.bind("<Button-5>", lambda e: self._scroll_tree1(1, 3))
+        self.tree1.bind("<Up>", lambda e: self._move_tree1_selection(-1))
+        self.tree1.bind("<Down>", lambda e: self._move_tree1_selection(1))
+        self.tree1.bind("<Prior>", lambda e: self._scroll_tree1(-1, self._tree1_page_size()))
+        self.tree1.bind("<Next>", lambda e: self._scroll_tree1(1, self._tree1_page_size()))
     
     def setup_tab2(self):
         """탭 2 설정: 조회 결과 및 상세정보"""
@@ -171,13 +352,19 @@ class DigikeyViewerApp:
         paned.add(right_frame, weight=2)
         
         # 상세정보 라벨
-        ttk.Label(right_frame, text="상세 정보", font=("Arial", 12, "bold")).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(right_frame, text="상세 정보", font=self.font_title).pack(anchor=tk.W, pady=(0, 10))
         
         # 상세정보 텍스트 위젯 (읽기 전용)
         scrollbar_detail = ttk.Scrollbar(right_frame, orient=tk.VERTICAL)
         self.detail_text = tk.Text(right_frame, yscrollcommand=scrollbar_detail.set, wrap=tk.WORD, width=40, state=tk.DISABLED)
         scrollbar_detail.config(command=self.detail_text.yview)
         
+        # URL 링크 태그는 한 번만 설정하고 클릭은 하나의 핸들러에서 위치로 판별
+        self.detail_text.tag_config("url_link", foreground="blue", underline=True)
+        self.detail_text.tag_bind("url_link", "<Button-1>", self._on_detail_url_click)
+        self.detail_text.tag_bind("url_link", "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
+        self.detail_text.tag_bind("url_link", "<Leave>", lambda e: self.detail_text.config(cursor=""))
+        
         self.detail_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar_detail.pack(side=tk.RIGHT, fill=tk.Y)
     
@@ -185,53 +372,65 @@ class DigikeyViewerApp:
         """config.txt 파일에서 API 키 로드"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith('#'):
-                            continue
-                        
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            if key.lower() == 'clientid':
-                                self.digikey_api.client_id = value
-                            elif key.lower() == 'clientsecret':
-                                self.digikey_api.client_secret = value
-                            elif key.lower() == 'usesandbox' or key.lower() == 'sandbox':
-                                # 샌드박스 환경 설정 (기본값: False, 프로덕션)
-                                self.digikey_api.use_sandbox = value.lower() in ('true', '1', 'yes')
-                                self.digikey_api.base_url = (
-                                    self.digikey_api.SANDBOX_BASE_URL 
-                                    if self.digikey_api.use_sandbox 
-                                    else self.digikey_api.PRODUCTION_BASE_URL
-                                )
-                            elif key.lower() == 'redirecturi':
-                                # RedirectURI는 저장만 하고 사용하지 않음 (필요시 사용 가능)
-                                pass
+                config_data = {key.lower(): value for key, value in _parse_config(self.config_file).items()}
+                
+                # 키(소문자)별 설정 함수 (RedirectURI는 저장만 하고 사용하지 않음)
+                handlers = {
+                    'clientid': self._set_config_client_id,
+                    'clientsecret': self._set_config_client_secret,
+                    'usesandbox': self._set_config_sandbox,
+                    'sandbox': self._set_config_sandbox,
+                }
+                for key, value in config_data.items():
+                    handler = handlers.get(key)
+                    if handler is not None:
+                        handler(value)
             except Exception as e:
                 print(f"config 파일 읽기 오류: {str(e)}")
     
+    def _set_config_client_id(self, value):
+        """config의 ClientID 적용"""
+        self.digikey_api.client_id = value
+    
+    def _set_config_client_secret(self, value):
+        """config의 ClientSecret 적용"""
+        self.digikey_api.client_secret = value
+    
+    def _set_config_sandbox(self, value):
+        """config의 UseSandbox/Sandbox 적용 (기본값: False, 프로덕션)"""
+        self.digikey_api.use_sandbox = value.lower() in ('true', '1', 'yes')
+    
     def save_config(self, client_id, client_secret, use_sandbox=True):
-        """config.txt 파일에 API 키 저장 (중복 방지)"""
+        """
+        config.txt 파일에 API 키 저장 요청 (작업 스레드에서 기록하므로 바로 반환)
+        아직 기록되지 않은 이전 요청이 있으면 최신 값으로 대체하여 한 번만 기록
+        """
+        item = (client_id, client_secret, use_sandbox)
+        while True:
+            try:
+                self._config_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._config_queue.get_nowait()
+                    self._config_queue.task_done()
+                except queue.Empty:
+                    pass
+    
+    def _config_writer(self):
+        """config.txt 저장 작업 스레드 (save_config 요청을 순서대로 기록)"""
+        while True:
+            item = self._config_queue.get()
+            try:
+                self._write_config(*item)
+            finally:
+                self._config_queue.task_done()
+    
+    def _write_config(self, client_id, client_secret, use_sandbox):
+        """config.txt 파일에 API 키 기록 (중복 방지)"""
         try:
             # 기존 config 파일 읽기
-            config_data = {}
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith('#'):
-                            continue
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            # 중복 키 방지: 첫 번째 값만 사용
-                            if key not in config_data:
-                                config_data[key] = value
+            config_data = _parse_config(self.config_file) if os.path.exists(self.config_file) else {}
             
             # API 키 및 환경 설정 업데이트 (기존 값 덮어쓰기)
             config_data['ClientID'] = client_id
@@ -242,17 +441,18 @@ class DigikeyViewerApp:
             if 'RedirectURI' not in config_data:
                 config_data['RedirectURI'] = 'https://localhost'
             
-            # config 파일에 저장 (순서대로)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                # 주요 설정을 먼저 저장
-                if 'ClientID' in config_data:
-                    f.write(f"ClientID={config_data['ClientID']}\n")
-                if 'ClientSecret' in config_data:
-                    f.write(f"ClientSecret={config_data['ClientSecret']}\n")
-                if 'RedirectURI' in config_data:
-                    f.write(f"RedirectURI={config_data['RedirectURI']}\n")
-                if 'UseSandbox' in config_data:
-                    f.write(f"UseSandbox={config_data['UseSandbox']}\n")
+            # 주요 설정 순서대로 내용을 만든 뒤 임시 파일에 한 번에 쓰고 교체 (저장 중 오류/정전 시 기존 파일 유지)
+            body = "".join(
+                f"{key}={config_data[key]}\n"
+                for key in ('ClientID', 'ClientSecret', 'RedirectURI', 'UseSandbox')
+            )
+            temp_file = self.config_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(body)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
+            _fsync_directory(os.path.dirname(os.path.abspath(self.config_file)))
         except Exception as e:
             print(f"config 파일 저장 오류: {str(e)}")
     
@@ -267,16 +467,12 @@ class DigikeyViewerApp:
         self.root.lower()
         
         # 독립적인 윈도우로 생성
-        setup_window = tk.Toplevel(self.root)
+        setup_window = self._new_toplevel()
         setup_window.title("엑셀 파일 및 시트 선택")
-        setup_window.geometry("500x300")
         setup_window.resizable(False, False)
         
         # 창 중앙 배치
-        setup_window.update_idletasks()
-        x = (setup_window.winfo_screenwidth() // 2) - (setup_window.winfo_width() // 2)
-        y = (setup_window.winfo_screenheight() // 2) - (setup_window.winfo_height() // 2)
-        setup_window.geometry(f"+{x}+{y}")
+        _center_window(setup_window, 500, 300)
         
         # 모달 다이얼로그로 만들기
         setup_window.transient(self.root)
@@ -291,7 +487,7 @@ class DigikeyViewerApp:
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # 제목
-        title_label = ttk.Label(main_frame, text="엑셀 파일 및 시트를 선택하세요", font=("Arial", 12, "bold"))
+        title_label = ttk.Label(main_frame, text="엑셀 파일 및 시트를 선택하세요", font=self.font_title)
         title_label.pack(pady=(0, 20))
         
         # 파일 선택 섹션
@@ -311,20 +507,24 @@ class DigikeyViewerApp:
                     ("엑셀 파일 (통합문서 및 매크로 포함)", "*.xlsx *.xlsm"),
                     ("엑셀 97-2003 통합문서", "*.xls"),
                     ("모든 엑셀 파일", "*.xlsx *.xlsm *.xls"),
+                    ("CSV 파일", "*.csv *.tsv"),
                     ("모든 파일", "*.*")
                 ]
             )
             if filename:
-                self.file_path_var.set(filename)
-                try:
-                    self.excel_handler.load_file(filename)
-                    sheets = self.excel_handler.get_sheet_names()
-                    sheet_combo['values'] = sheets
-                    if sheets:
-                        sheet_var.set(sheets[0])
-                except Exception as e:
+                def on_loaded(sheets):
+                    confirm_button.config(state=tk.NORMAL, text="확인")
+                    self.file_path_var.set(filename)
+                
+                def on_error(e):
+                    confirm_button.config(state=tk.NORMAL, text="확인")
                     messagebox.showerror("오류", f"파일 로드 중 오류가 발생했습니다:\n{str(e)}")
                     self.file_path_var.set("")
+                
+                # 파일을 먼저 로드한 뒤 경로를 설정 (경로 변경 시 on_file_change에서 시트 목록 갱신)
+                # 작업 스레드에서 여는 동안 확인 버튼을 잠가 이전 파일의 시트로 진행하지 않게 함
+                confirm_button.config(state=tk.DISABLED, text="로드 중...")
+                self._run_when_done(self.excel_handler.load_file_async(filename), on_loaded, on_error)
         
         ttk.Button(file_frame, text="찾아보기...", command=browse_file).pack(side=tk.LEFT, padx=5)
         
@@ -354,9 +554,7 @@ class DigikeyViewerApp:
                 messagebox.showwarning("경고", "시트를 선택해주세요.")
                 return
             
-            try:
-                # 시트 로드
-                self.current_df = self.excel_handler.load_sheet(selected_sheet)
+            def on_loaded():
                 setup_window.destroy()
                 # 메인 윈도우를 앞으로 가져오기
                 self.root.lift()
@@ -365,27 +563,33 @@ class DigikeyViewerApp:
                 self.finish_setup(selected_sheet)
                 # 유저폼 완료 후 API 설정 확인
                 self.check_api_config_after_setup()
-            except Exception as e:
+            
+            def on_error(e):
+                confirm_button.config(state=tk.NORMAL, text="확인")
                 messagebox.showerror("오류", f"시트 로드 중 오류가 발생했습니다:\n{str(e)}")
+            
+            # 시트 로드 (작업 스레드에서 읽는 동안 버튼을 잠가 중복 실행 방지)
+            confirm_button.config(state=tk.DISABLED, text="로드 중...")
+            self._load_sheet_async(selected_sheet, on_loaded, on_error)
         
         def cancel_setup():
             if messagebox.askyesno("확인", "프로그램을 종료하시겠습니까?"):
                 setup_window.destroy()
                 self.root.quit()
         
-        ttk.Button(button_frame, text="확인", command=confirm_setup, width=15,).pack(side=tk.LEFT, padx=5)
+        confirm_button = ttk.Button(button_frame, text="확인", command=confirm_setup, width=15,)
+        confirm_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="취소", command=cancel_setup, width=15).pack(side=tk.LEFT, padx=5)
         
-        # 파일 변경 시 시트 목록 업데이트
+        # 파일 변경 시 시트 목록 업데이트 (load_file에서 읽어 둔 시트 이름 사용, 파일을 다시 열지 않음)
         def on_file_change(*args):
             if self.file_path_var.get():
-                try:
-                    sheets = self.excel_handler.get_sheet_names()
-                    sheet_combo['values'] = sheets
-                    if sheets:
-                        sheet_var.set(sheets[0])
-                except:
-                    pass
+                sheets = self.excel_handler.get_sheet_names()
+                sheet_combo['values'] = sheets
+                if sheets:
+                    sheet_var.set(sheets[0])
+        
+        self.file_path_var.trace_add("write", on_file_change)
         
         # 취소 버튼으로 창 닫기 방지 (확인 또는 취소 버튼만 사용)
         setup_window.protocol("WM_DELETE_WINDOW", cancel_setup)
@@ -407,18 +611,23 @@ class DigikeyViewerApp:
                 ("엑셀 파일 (통합문서 및 매크로 포함)", "*.xlsx *.xlsm"),
                 ("엑셀 97-2003 통합문서", "*.xls"),
                 ("모든 엑셀 파일", "*.xlsx *.xlsm *.xls"),
+                ("CSV 파일", "*.csv *.tsv"),
                 ("모든 파일", "*.*")
             ]
         )
         
         if filename:
-            try:
-                self.excel_handler.load_file(filename)
+            def on_loaded(sheets):
                 self.current_df = None
+                self._current_values = None
+                self._part_number_col = None
                 messagebox.showinfo("성공", f"파일이 로드되었습니다: {filename}")
                 self.select_sheet()
-            except Exception as e:
+            
+            def on_error(e):
                 messagebox.showerror("오류", f"파일 로드 중 오류가 발생했습니다:\n{str(e)}")
+            
+            self._run_when_done(self.excel_handler.load_file_async(filename), on_loaded, on_error)
     
     def select_sheet(self):
         """시트 선택 다이얼로그"""
@@ -432,7 +641,7 @@ class DigikeyViewerApp:
             return
         
         # 시트 선택 다이얼로그
-        sheet_window = tk.Toplevel(self.root)
+        sheet_window = self._new_toplevel()
         sheet_window.title("시트 선택")
         sheet_window.geometry("300x200")
         
@@ -444,24 +653,115 @@ class DigikeyViewerApp:
         
         def load_sheet():
             selected_sheet = sheet_var.get()
-            try:
-                self.current_df = self.excel_handler.load_sheet(selected_sheet)
+            
+            def on_loaded():
                 self.sheet_label.config(text=f"선택된 시트: {selected_sheet}")
                 self.display_sheet_data()
-                sheet_window.destroy()
-            except Exception as e:
+                if sheet_window.winfo_exists():
+                    sheet_window.destroy()
+            
+            def on_error(e):
+                if sheet_window.winfo_exists():
+                    load_button.config(state=tk.NORMAL, text="확인")
                 messagebox.showerror("오류", f"시트 로드 중 오류가 발생했습니다:\n{str(e)}")
+            
+            load_button.config(state=tk.DISABLED, text="로드 중...")
+            self._load_sheet_async(selected_sheet, on_loaded, on_error)
+        
+        load_button = ttk.Button(sheet_window, text="확인", command=load_sheet)
+        load_button.pack(pady=10)
+    
+    def _load_sheet_async(self, sheet_name, on_done, on_error):
+        """
+        시트를 작업 스레드에서 로드하고, 끝나면 메인 스레드에서 current_df를 설정한 뒤 콜백 호출
+        (로드 중에도 창이 멈추지 않도록 after로 완료 여부만 확인)
+        
+        Args:
+            sheet_name: 시트 이름
+            on_done: 로드 성공 시 호출할 함수 (인자 없음)
+            on_error: 로드 실패 시 예외를 받아 호출할 함수
+        """
+        def on_loaded(result):
+            self.current_df, self._current_values = result
+            self._part_number_col = None
+            on_done()
+            self._warm_part_cache()
+        
+        # 트리뷰 표시에 쓰는 object 배열 변환도 작업 스레드에서 처리
+        future = self.excel_handler.load_sheet_async(
+            sheet_name, prepare=lambda df: (df, df.to_numpy(dtype=object))
+        )
+        self._run_when_done(future, on_loaded, on_error)
+    
+    def _new_toplevel(self):
+        """
+        메인 윈도우의 Toplevel 창 생성 (종료 시 닫을 수 있도록 열린 창 목록에 등록, 닫히면 제거)
+        
+        Returns:
+            tk.Toplevel: 생성된 창
+        """
+        window = tk.Toplevel(self.root)
+        self._open_toplevels.add(window)
+        
+        def on_destroy(event):
+            # 자식 위젯의 Destroy 이벤트도 Toplevel 바인딩으로 전달되므로 창 자신일 때만 제거
+            if event.widget is window:
+                self._open_toplevels.discard(window)
+        
+        window.bind("<Destroy>", on_destroy, add="+")
+        return window
+    
+    def _warm_part_cache(self):
+        """
+        새로 불러온 시트의 파트넘버를 백그라운드에서 DB 일괄 조회하여 DB 메모리 캐시에 올려 둠
+        (첫 더블클릭 조회가 DB 결과를 SQLite 없이 바로 사용, API는 호출하지 않아 일일 호출 수에 영향 없음)
+        """
+        part_number_col = self.find_part_number_column()
+        if part_number_col is None:
+            return
         
-        ttk.Button(sheet_window, text="확인", command=load_sheet).pack(pady=10)
+        def warm():
+            try:
+                _, part_numbers = self.get_part_number_values(part_number_col)
+                self.part_db.get_parts_bulk(part_numbers[:PartDatabase.PART_CACHE_SIZE])
+            except Exception as e:
+                print(f"파트넘버 DB 미리 조회 오류: {str(e)}")
+        
+        threading.Thread(target=warm, name="part-cache-warm", daemon=True).start()
+    
+    def _run_when_done(self, future, on_done, on_error):
+        """
+        작업 스레드의 Future가 끝나면 메인 스레드에서 콜백 호출 (위젯은 메인 스레드에서만 변경)
+        끝날 때까지 마우스 커서를 대기 모양으로 표시하고 after로 완료 여부만 확인
+        
+        Args:
+            future: 작업 스레드에서 실행 중인 Future
+            on_done: 성공 시 결과를 받아 호출할 함수
+            on_error: 실패 시 예외를 받아 호출할 함수
+        """
+        self.root.config(cursor="watch")
+        
+        def check_done():
+            if not future.done():
+                self.root.after(SHEET_LOAD_POLL_MS, check_done)
+                return
+            self.root.config(cursor="")
+            try:
+                result = future.result()
+            except Exception as e:
+                on_error(e)
+                return
+            on_done(result)
+        
+        self.root.after(SHEET_LOAD_POLL_MS, check_done)
     
     def display_sheet_data(self):
         """시트 데이터를 트리뷰에 표시"""
         if self.current_df is None or self.current_df.empty:
             return
         
-        # 기존 항목 삭제
-        for item in self.tree1.get_children():
-            self.tree1.delete(item)
+        # 기존 항목 삭제 (한 번의 호출로 모두 삭제)
+        self.tree1.delete(*self.tree1.get_children())
         
         # 컬럼 설정
         columns = list(self.current_df.columns)
@@ -473,10 +773,110 @@ class DigikeyViewerApp:
             self.tree1.heading(col, text=col)
             self.tree1.column(col, width=150, anchor=tk.W)
         
-        # 데이터 삽입
-        for index, row in self.current_df.iterrows():
-            values = [str(val) for val in row.values]
-            self.tree1.insert("", tk.END, values=values, iid=index)
+        # iterrows는 행마다 Series를 만들므로 object 배열로 한 번에 변환하여 사용 (시트 로드 시 미리 변환한 배열 재사용)
+        if self._current_values is None or len(self._current_values) != len(self.current_df):
+            self._current_values = self.current_df.to_numpy(dtype=object)
+        values_matrix = self._current_values
+        
+        # 행이 많으면 화면에 보이는 행만 넣고 스크롤할 때마다 교체 (트리뷰 항목 수를 화면 크기로 제한)
+        if len(values_matrix) > TREE_VIRTUAL_ROW_THRESHOLD:
+            self._tree1_rows = (self.current_df.index, values_matrix)
+            self._tree1_offset = 0
+            self._tree1_selected = None
+            self.tree1.configure(yscrollcommand="")
+            self.tree1_scrollbar_y.config(command=self._tree1_yview)
+            self._render_tree1_rows()
+            return
+        
+        self._tree1_rows = None
+        self.tree1.configure(yscrollcommand=self.tree1_scrollbar_y.set)
+        self.tree1_scrollbar_y.config(command=self.tree1.yview)
+        
+        # 데이터 삽입 (묶음 단위로 넣고 그 사이에 화면 갱신 처리)
+        for count, (index, row) in enumerate(zip(self.current_df.index, values_matrix), 1):
+            self.tree1.insert("", tk.END, values=[str(val) for val in row], iid=index)
+            if count % TREE_INSERT_CHUNK_SIZE == 0:
+                self.root.update_idletasks()
+    
+    def _tree1_page_size(self) -> int:
+        """트리뷰 화면에 한 번에 보이는 행 수"""
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            row_height = int(row_height)
+        except (TypeError, ValueError):
+            row_height = 20
+        return max(1, self.tree1.winfo_height() // row_height)
+    
+    def _render_tree1_rows(self):
+        """가상 스크롤: 현재 위치에서 화면에 보이는 행만 트리뷰에 표시"""
+        if self._tree1_rows is None:
+            return
+        index, values_matrix = self._tree1_rows
+        total = len(values_matrix)
+        page = self._tree1_page_size()
+        self._tree1_offset = max(0, min(self._tree1_offset, total - page))
+        start = self._tree1_offset
+        end = min(total, start + page)
+        
+        self._tree1_rendering = True
+        try:
+            self.tree1.delete(*self.tree1.get_children())
+            for i in range(start, end):
+                self.tree1.insert("", tk.END, values=[str(val) for val in values_matrix[i]], iid=index[i])
+            if self._tree1_selected is not None and self.tree1.exists(self._tree1_selected):
+                self.tree1.selection_set(self._tree1_selected)
+                self.tree1.focus(self._tree1_selected)
+        finally:
+            self._tree1_rendering = False
+        self.tree1_scrollbar_y.set(start / total, end / total)
+    
+    def _tree1_yview(self, *args):
+        """가상 스크롤: 세로 스크롤바 명령 처리 (moveto / scroll)"""
+        if self._tree1_rows is None:
+            return
+        total = len(self._tree1_rows[1])
+        if args[0] == "moveto":
+            self._tree1_offset = int(float(args[1]) * total)
+            self._render_tree1_rows()
+        elif args[0] == "scroll":
+            step = self._tree1_page_size() if args[2] == "pages" else 1
+            self._scroll_tree1(int(args[1]), step)
+    
+    def _scroll_tree1(self, direction: int, step: int):
+        """가상 스크롤: direction(-1 위, 1 아래) 방향으로 step행 이동"""
+        if self._tree1_rows is None:
+            return None  # 모든 행을 넣은 경우 트리뷰 기본 동작 사용
+        self._tree1_offset += direction * step
+        self._render_tree1_rows()
+        return "break"
+    
+    def _move_tree1_selection(self, direction: int):
+        """가상 스크롤: 방향키로 선택 이동 (화면 끝이면 한 줄 스크롤)"""
+        if self._tree1_rows is None:
+            return None
+        children = self.tree1.get_children()
+        if not children:
+            return "break"
+        current = self.tree1.focus() or children[0]
+        position = children.index(current) if current in children else 0
+        position += direction
+        if position < 0 or position >= len(children):
+            # 화면 끝이면 한 줄 스크롤 후 새로 보이는 첫/끝 행 선택
+            self._scroll_tree1(direction, 1)
+            children = self.tree1.get_children()
+            position = 0 if direction < 0 else len(children) - 1
+        target = children[position]
+        self._tree1_selected = target
+        self.tree1.selection_set(target)
+        self.tree1.focus(target)
+        return "break"
+    
+    def _on_tree1_select(self, event=None):
+        """가상 스크롤: 선택된 행 기억 (행을 다시 그릴 때 선택 복원)"""
+        if self._tree1_rows is None or self._tree1_rendering:
+            return
+        selection = self.tree1.selection()
+        self._tree1_selected = selection[0] if selection else None
     
     def clean_part_number(self, part_number: str) -> str:
         """
@@ -491,11 +891,8 @@ class DigikeyViewerApp:
         if not part_number:
             return part_number
         
-        # 앞뒤 공백 제거
-        cleaned = part_number.strip()
-        
-        # 줄바꿈, 탭 문자 제거
-        cleaned = cleaned.replace('\n', '').replace('\r', '').replace('\t', '')
+        # 앞뒤 공백 제거 후 줄바꿈, 탭 문자 제거 (변환 테이블로 한 번에 처리)
+        cleaned = part_number.strip().translate(_PART_NUMBER_STRIP_TABLE)
         
         # 연속된 공백을 하나로 (단, 파트넘버 내부 공백은 유지)
         # 예: "ABC  123" -> "ABC 123" (너무 공격적이지 않게)
@@ -515,26 +912,90 @@ class DigikeyViewerApp:
         if not result:
             return True
         
-        # Manufacturer가 "검색 결과 없음"인 경우
-        if result.get('Manufacturer') == '검색 결과 없음':
-            return True
-        
         # Error 필드가 있는 경우
-        if 'Error' in result or 'error' in result:
+        if result.keys() & _QUERY_ERROR_KEYS:
             return True
         
-        # Manufacturer가 "API 오류" 또는 "조회 실패"인 경우
-        manufacturer = result.get('Manufacturer', '')
-        if manufacturer in ['API 오류', '조회 실패']:
-            return True
+        # Manufacturer가 "검색 결과 없음", "API 오류", "조회 실패", "오류 발생"인 경우
+        return result.get('Manufacturer', '') in _QUERY_FAILED_MANUFACTURERS
+    
+    def _similarity_ratio(self, a: str, b: str, min_ratio: float = 0.0) -> float:
+        """
+        두 문자열의 유사도 반환 (0~1). 대소문자 무시.
         
-        return False
+        Args:
+            a, b: 비교할 문자열
+            min_ratio: 이 값 미만이 확실하면 전체 계산 없이 0.0 반환
+        """
+        if not a or not b:
+            return 0.0
+        return self._normalized_similarity(a.lower().strip(), b.lower().strip(), min_ratio)
     
-    def _similarity_ratio(self, a: str, b: str) -> float:
-        """두 문자열의 유사도 반환 (0~1). 대소문자 무시."""
+    def _normalized_similarity(self, a: str, b: str, min_ratio: float = 0.0) -> float:
+        """
+        소문자 변환과 공백 제거가 끝난 두 문자열의 유사도 반환 (0~1)
+        
+        Args:
+            a, b: 정리된 문자열 (빈 문자열이면 0.0)
+            min_ratio: 이 값 미만이 확실하면 전체 계산 없이 0.0 반환
+        """
         if not a or not b:
             return 0.0
-        return difflib.SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+        if a == b:
+            return 1.0
+        # 길이 차이만으로 얻을 수 있는 최대 유사도가 기준 미만이면 계산 생략
+        if 2.0 * min(len(a), len(b)) / (len(a) + len(b)) < min_ratio:
+            return 0.0
+        if fuzz is not None:
+            return fuzz.ratio(a, b, score_cutoff=min_ratio * 100) / 100.0
+        matcher = difflib.SequenceMatcher(None, a, b)
+        if matcher.quick_ratio() < min_ratio:
+            return 0.0
+        return matcher.ratio()
+    
+    def _rank_similar_parts(self, part_number: str, candidates: list) -> list:
+        """
+        후보 제품을 파트넘버 유사도 순으로 정렬하여 반환
+        
+        Args:
+            part_number: 기준 파트넘버
+            candidates: 제품 정보 딕셔너리 목록
+            
+        Returns:
+            list: 유사도 SIMILAR_PARTS_MIN_RATIO 이상인 후보의 복사본 (최대 SIMILAR_PARTS_MAX_COUNT개,
+                  'Similarity' 키에 유사도 포함)
+        """
+        if not part_number or not candidates:
+            return []
+        
+        # 기준/후보 파트넘버는 한 번만 정리 (후보마다 비교할 때 다시 정리하지 않음)
+        query = part_number.lower().strip()
+        choices = [(r.get("PartNumber") or "").lower().strip() for r in candidates]
+        
+        if process is not None:
+            # 후보 전체를 한 번에 점수화 (기준 미달 후보는 계산 중 조기 제외)
+            matches = process.extract(
+                query, choices, scorer=fuzz.ratio,
+                score_cutoff=SIMILAR_PARTS_MIN_RATIO * 100, limit=SIMILAR_PARTS_MAX_COUNT
+            )
+            ranked = []
+            for choice, score, index in matches:
+                if not choice:
+                    continue
+                r_copy = dict(candidates[index])
+                r_copy["Similarity"] = score / 100.0
+                ranked.append(r_copy)
+            return ranked
+        
+        ranked = []
+        for r, choice in zip(candidates, choices):
+            ratio = self._normalized_similarity(query, choice, SIMILAR_PARTS_MIN_RATIO)
+            if ratio >= SIMILAR_PARTS_MIN_RATIO:
+                r_copy = dict(r)
+                r_copy["Similarity"] = ratio
+                ranked.append(r_copy)
+        ranked.sort(key=lambda x: x.get("Similarity", 0), reverse=True)
+        return ranked[:SIMILAR_PARTS_MAX_COUNT]
     
     def show_similar_parts_selection_dialog(self, original_part_number: str, row_index: int, similar_list: list) -> tuple:
         """
@@ -550,7 +1011,7 @@ class DigikeyViewerApp:
         """
         if not similar_list:
             return (None, False)
-        sel_window = tk.Toplevel(self.root)
+        sel_window = self._new_toplevel()
         sel_window.title("유사 자재 선택")
         sel_window.geometry("750x400")
         sel_window.resizable(True, True)
@@ -560,7 +1021,7 @@ class DigikeyViewerApp:
         sel_window.lift()
         main_frame = ttk.Frame(sel_window, padding="15")
         main_frame.pack(fill=tk.BOTH, expand=True)
-        ttk.Label(main_frame, text=f"'{original_part_number}' (Row {row_index})에 대한 유사 자재입니다. 하나를 선택하세요.", font=("Arial", 10, "bold")).pack(pady=(0, 10))
+        ttk.Label(main_frame, text=f"'{original_part_number}' (Row {row_index})에 대한 유사 자재입니다. 하나를 선택하세요.", font=self.font_heading).pack(pady=(0, 10))
         columns = ("similarity", "part", "manufacturer", "mounting", "description")
         tree = ttk.Treeview(main_frame, columns=columns, show="headings", height=12, selectmode="browse")
         tree.heading("similarity", text="유사도(%)")
@@ -575,14 +1036,12 @@ class DigikeyViewerApp:
         tree.column("description", width=250)
         scroll_y = ttk.Scrollbar(main_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscrollcommand=scroll_y.set)
-        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        # 행을 모두 넣은 뒤에 배치 (삽입할 때마다 레이아웃을 다시 계산하지 않음)
+        # Similarity는 _rank_similar_parts에서 항상 0~1 실수로 채워짐
         for i, item in enumerate(similar_list):
-            sim = item.get("Similarity", 0)
-            pct = f"{sim * 100:.0f}%" if isinstance(sim, (int, float)) else str(sim)
-            desc = (item.get("Description") or "N/A")[:50]
-            if len((item.get("Description") or "")) > 50:
-                desc += "..."
+            pct = f"{item.get('Similarity', 0.0) * 100:.0f}%"
+            raw_desc = item.get("Description") or ""
+            desc = raw_desc[:50] + "..." if len(raw_desc) > 50 else (raw_desc or "N/A")
             tree.insert("", tk.END, iid=i, values=(
                 pct,
                 item.get("PartNumber", ""),
@@ -590,6 +1049,8 @@ class DigikeyViewerApp:
                 item.get("MountingType", "N/A"),
                 desc
             ))
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
         selected_result = [None]
         def on_ok():
             sel = tree.selection()
@@ -623,16 +1084,12 @@ class DigikeyViewerApp:
                    사용자가 취소하면 (None, False) 반환
                    웹 검색을 했을 때는 (파트넘버, False) 반환 (API 재조회하지 않음)
         """
-        edit_window = tk.Toplevel(self.root)
+        edit_window = self._new_toplevel()
         edit_window.title("파트넘버 조회 실패")
-        edit_window.geometry("550x280")
         edit_window.resizable(False, False)
         
         # 창 중앙 배치
-        edit_window.update_idletasks()
-        x = (edit_window.winfo_screenwidth() // 2) - (edit_window.winfo_width() // 2)
-        y = (edit_window.winfo_screenheight() // 2) - (edit_window.winfo_height() // 2)
-        edit_window.geometry(f"+{x}+{y}")
+        _center_window(edit_window, 550, 280)
         
         # 모달 다이얼로그로 만들기
         edit_window.transient(self.root)
@@ -648,7 +1105,7 @@ class DigikeyViewerApp:
         title_label = ttk.Label(
             main_frame, 
             text="파트넘버 조회 실패", 
-            font=("Arial", 12, "bold")
+            font=self.font_title
         )
         title_label.pack(pady=(0, 10))
         
@@ -659,7 +1116,7 @@ class DigikeyViewerApp:
                  f"파트넘버에 오타나 불필요한 문자가 있을 수 있습니다.\n"
                  f"수정 후 Google에서 검색하거나 건너뛸 수 있습니다.",
             justify=tk.LEFT,
-            font=("Arial", 9)
+            font=self.font_small
         )
         info_label.pack(pady=(0, 15))
         
@@ -686,10 +1143,9 @@ class DigikeyViewerApp:
             if not modified:
                 modified = original_part_number
             
-            # Google에서 디지키 사이트 검색
-            search_query = f"{modified}"
-            google_url = f"https://www.google.com/search?q={search_query}"
-            webbrowser.open(google_url)
+            # Google에서 디지키 사이트 검색 ('#', '+', '&' 등이 포함된 파트넘버도 그대로 검색되도록 인코딩)
+            google_url = f"https://www.google.com/search?q={quote_plus(modified)}"
+            self._get_browser().open(google_url)
             
             # 웹 검색을 했으므로 결과 저장 (API 재조회하지 않음)
             result[0] = modified
@@ -723,6 +1179,24 @@ class DigikeyViewerApp:
         
         return tuple(result)
     
+    def _check_daily_api_limit(self):
+        """
+        오늘 API 호출 횟수가 일일 제한에 도달했으면 API를 호출하기 전에 중단
+        
+        (초당 호출 속도는 DigikeyAPIClient의 토큰 버킷이 제한하므로 여기서는 일일 한도만 확인)
+        
+        Raises:
+            RateLimitExceeded: 일일 제한 도달 시 (retry_after: 자정까지 남은 초)
+        """
+        today_calls = self.part_db.get_today_api_calls()
+        if today_calls >= self.api_daily_limit:
+            now = datetime.now()
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            raise RateLimitExceeded(
+                f"오늘 API 호출 횟수({today_calls}회)가 일일 제한({self.api_daily_limit}회)에 도달했습니다.",
+                retry_after=int((midnight - now).total_seconds())
+            )
+    
     def query_part_with_retry(self, part_number: str, row_index: int, progress_window=None) -> tuple:
         """
         파트넘버 조회 (실패 시 정리 및 재시도, 웹 검색 옵션 제공)
@@ -750,10 +1224,14 @@ class DigikeyViewerApp:
         
         # DB에 없는 경우에만 API 조회
         try:
+            from_cache = self.digikey_api.is_search_cached(part_number)
+            if not from_cache:
+                self._check_daily_api_limit()
             api_result = self.digikey_api.search_part(part_number)
-            if api_result:
+            if api_result and not from_cache:
                 api_call_count += 1
                 self.part_db.increment_api_call()
+            if api_result:
                 if not self.is_query_failed(api_result):
                     # 성공한 경우 DB에 저장
                     self.part_db.save_part(api_result)
@@ -778,13 +1256,21 @@ class DigikeyViewerApp:
         if self.is_query_failed(result):
             # 2차: 기본 정리 후 재조회
             cleaned_part = self.clean_part_number(part_number)
-            if cleaned_part != part_number:
+            # 정리된 파트넘버를 이미 조회한 적이 있으면 (다른 행 등) DB 결과를 사용하고 API를 다시 호출하지 않음
+            cleaned_db_result = self.part_db.get_part(cleaned_part) if cleaned_part != part_number else None
+            if cleaned_db_result and not self.is_query_failed(cleaned_db_result):
+                return (cleaned_db_result, api_call_count)
+            if cleaned_part != part_number and not cleaned_db_result:
                 # 정리된 버전으로 재조회 시도
                 try:
+                    from_cache = self.digikey_api.is_search_cached(cleaned_part)
+                    if not from_cache:
+                        self._check_daily_api_limit()
                     cleaned_result = self.digikey_api.search_part(cleaned_part)
-                    if cleaned_result:
+                    if cleaned_result and not from_cache:
                         api_call_count += 1
                         self.part_db.increment_api_call()
+                    if cleaned_result:
                         if not self.is_query_failed(cleaned_result):
                             # 성공한 경우 DB에 저장
                             self.part_db.save_part(cleaned_result)
@@ -798,18 +1284,23 @@ class DigikeyViewerApp:
             
             # 2.5차: 유사 자재 검색 (최대 10개, 유사도 60% 이상) → 사용자 선택
             try:
+                self._check_daily_api_limit()
                 similar_raw = self.digikey_api.search_part_multiple(original_part_number, 15)
                 api_call_count += 1
                 self.part_db.increment_api_call()
-                similar_with_ratio = []
-                for r in similar_raw:
-                    ratio = self._similarity_ratio(original_part_number, r.get("PartNumber", ""))
-                    if ratio >= SIMILAR_PARTS_MIN_RATIO:
-                        r_copy = dict(r)
-                        r_copy["Similarity"] = ratio
-                        similar_with_ratio.append(r_copy)
-                similar_with_ratio.sort(key=lambda x: x.get("Similarity", 0), reverse=True)
-                similar_filtered = similar_with_ratio[:SIMILAR_PARTS_MAX_COUNT]
+                # DB에 저장된 파트 중 앞/뒤가 같은 파트도 후보에 추가 (추가 API 호출 없음)
+                api_part_numbers = {r.get("PartNumber") for r in similar_raw}
+                # 후보는 유사도 순으로 받아 한 번의 일괄 조회로 가져옴 (후보마다 get_part 호출하지 않음)
+                candidates = [
+                    pn for pn in self.part_db.find_similar_part_numbers(original_part_number)
+                    if pn not in api_part_numbers
+                ]
+                db_parts = self.part_db.get_parts_bulk(candidates)
+                for pn in candidates:
+                    db_part = db_parts.get(pn.strip())
+                    if db_part and not self.is_query_failed(db_part):
+                        similar_raw.append(db_part)
+                similar_filtered = self._rank_similar_parts(original_part_number, similar_raw)
                 if similar_filtered:
                     if progress_window:
                         progress_window.withdraw()
@@ -876,6 +1367,10 @@ class DigikeyViewerApp:
     
     def on_part_double_click(self, event):
         """파트넘버 더블클릭 이벤트 처리"""
+        # 조회 중에도 진행 상황 갱신을 위해 이벤트를 처리하므로, 그 사이의 더블클릭으로 조회가 겹치지 않게 함
+        if self._query_running:
+            return
+        
         selection = self.tree1.selection()
         if not selection:
             return
@@ -891,8 +1386,10 @@ class DigikeyViewerApp:
         if self.current_df is None or row_index >= len(self.current_df):
             return
         
-        # 파트넘버 컬럼 찾기 (대소문자 무시)
-        part_number_col = self.find_part_number_column()
+        # 파트넘버 컬럼 찾기 (대소문자 무시) - 같은 시트에서는 처음 찾은 컬럼을 재사용
+        part_number_col = self._part_number_col
+        if part_number_col is None:
+            part_number_col = self.find_part_number_column()
         
         if part_number_col is None:
             # 컬럼을 찾지 못한 경우 사용자에게 선택하게 함
@@ -900,38 +1397,46 @@ class DigikeyViewerApp:
             if part_number_col is None:
                 return  # 사용자가 취소한 경우
         
-        # 선택한 행부터 아래로 순환하며 조회
-        self.query_parts_from_row(row_index, part_number_col)
+        self._part_number_col = part_number_col
+        
+        # 선택한 행부터 아래로 순환하며 조회 (조회 중 DB 저장은 묶어서 기록)
+        self._query_running = True
+        try:
+            with self.part_db.batch():
+                self.query_parts_from_row(row_index, part_number_col)
+        finally:
+            self._query_running = False
+        
+        # 조회 중에 종료를 요청한 경우 조회를 정리한 뒤 종료
+        if self._close_requested:
+            self.on_closing()
+    
+    def get_part_number_values(self, part_number_col, start_row: int = 0):
+        """
+        파트넘버 컬럼에서 빈 값을 제외하고 앞뒤 공백을 제거한 파트넘버와 행 위치 반환
+        
+        Args:
+            part_number_col: 파트넘버 컬럼 이름
+            start_row: 시작 행 위치
+            
+        Returns:
+            (행 위치 리스트, 파트넘버 리스트) - start_row 행부터, 결측값/공백뿐인 값 제외
+        """
+        column = self.current_df[part_number_col].iloc[start_row:]
+        # 결측값은 문자열로 바꾸지 않고 notna로 먼저 제외 (map(str)은 pandas 버전과 무관하게 기존 str(값)과 동일한 결과)
+        not_null = column.notna().to_numpy()
+        stripped = column[not_null].map(str).str.strip().to_numpy(dtype=object)
+        non_empty = stripped != ''
+        row_positions = (not_null.nonzero()[0][non_empty] + start_row).tolist()
+        return row_positions, stripped[non_empty].tolist()
     
     def find_part_number_column(self):
         """파트넘버 컬럼 자동 찾기"""
         if self.current_df is None or self.current_df.empty:
             return None
         
-        # 다양한 패턴으로 파트넘버 컬럼 찾기
-        possible_patterns = [
-            # 정확한 매칭
-            lambda col: 'part' in col.lower() and 'number' in col.lower(),
-            # 파트넘버 (한글)
-            lambda col: '파트' in col and '넘버' in col,
-            lambda col: '파트' in col and '번호' in col,
-            # Part Number (공백 포함)
-            lambda col: col.lower().replace(' ', '') == 'partnumber',
-            lambda col: col.lower().replace('_', '') == 'partnumber',
-            # Part만 포함
-            lambda col: col.lower() == 'part',
-            lambda col: col.lower() == 'partno',
-            lambda col: col.lower() == 'part_no',
-            # Number만 포함 (일부 경우)
-            lambda col: col.lower() == 'number' and 'part' not in col.lower(),
-        ]
-        
-        for pattern in possible_patterns:
-            for col in self.current_df.columns:
-                if pattern(col):
-                    return col
-        
-        return None
+        # 컬럼 구성이 같으면 이전 결과 재사용
+        return _find_part_number_column_cached(tuple(self.current_df.columns))
     
     def select_part_number_column(self):
         """사용자에게 파트넘버 컬럼 선택하게 함"""
@@ -941,20 +1446,16 @@ class DigikeyViewerApp:
         columns = list(self.current_df.columns)
         
         # 컬럼 선택 다이얼로그
-        col_window = tk.Toplevel(self.root)
+        col_window = self._new_toplevel()
         col_window.title("파트넘버 컬럼 선택")
-        col_window.geometry("350x200")
         col_window.transient(self.root)
         col_window.grab_set()
         col_window.focus_set()
         
         # 창 중앙 배치
-        col_window.update_idletasks()
-        x = (col_window.winfo_screenwidth() // 2) - (col_window.winfo_width() // 2)
-        y = (col_window.winfo_screenheight() // 2) - (col_window.winfo_height() // 2)
-        col_window.geometry(f"+{x}+{y}")
+        _center_window(col_window, 350, 200)
         
-        ttk.Label(col_window, text="파트넘버 컬럼을 선택하세요:", font=("Arial", 10, "bold")).pack(pady=10)
+        ttk.Label(col_window, text="파트넘버 컬럼을 선택하세요:", font=self.font_heading).pack(pady=10)
         
         col_var = tk.StringVar()
         if columns:
@@ -992,58 +1493,47 @@ class DigikeyViewerApp:
         api_calls = 0  # API 호출 횟수
         
         # v1.2.4: 전체 조회할 파트넘버 개수 계산 (빈 값 제외)
-        total_parts = 0
-        for idx in range(start_row, len(self.current_df)):
-            part_number = str(self.current_df.iloc[idx][part_number_col]).strip()
-            if part_number and part_number != 'nan':
-                total_parts += 1
-        
-        # 진행 상황 표시
-        progress_window = tk.Toplevel(self.root)
-        progress_window.title("조회 중...")
-        progress_window.geometry("450x150")
-        progress_window.resizable(False, False)
-        
-        # 창 중앙 배치
-        progress_window.update_idletasks()
-        x = (progress_window.winfo_screenwidth() // 2) - (progress_window.winfo_width() // 2)
-        y = (progress_window.winfo_screenheight() // 2) - (progress_window.winfo_height() // 2)
-        progress_window.geometry(f"+{x}+{y}")
-        
-        progress_label = ttk.Label(progress_window, text="파트넘버를 조회하고 있습니다...", font=("Arial", 10, "bold"))
-        progress_label.pack(pady=10)
+        # 빈 값을 제외한 파트넘버와 그 행 위치만 남김 (행마다 iloc 조회 대신 pandas 연산 사용, 조회 루프에서 빈 행을 다시 검사하지 않음)
+        row_positions, part_numbers = self.get_part_number_values(part_number_col, start_row)
+        total_parts = len(part_numbers)
         
-        # v1.2.4: 진행 상황 표시 (전체/조회 완료)
-        progress_count_label = ttk.Label(progress_window, text=f"조회 진행: 0 / {total_parts}개", font=("Arial", 9))
-        progress_count_label.pack(pady=2)
+        # DB에 저장된 결과는 한 번의 일괄 조회로 미리 가져옴 (행마다 DB 조회하지 않음)
+        db_results = self.part_db.get_parts_bulk(part_numbers)
         
-        progress_detail = ttk.Label(progress_window, text="", font=("Arial", 8))
-        progress_detail.pack(pady=5)
-        
-        # 진행률 바 추가
-        progress_bar = ttk.Progressbar(progress_window, length=400, mode='determinate', maximum=total_parts)
-        progress_bar.pack(pady=5)
+        # 진행 상황 표시 (이전 조회에서 만든 창을 재사용)
+        progress_window, progress_count_label, progress_detail, progress_bar = self._show_progress_window(total_parts)
         
         self.root.update()
         
         queried_count = 0  # 조회 완료한 개수
         
         try:
+            # DB에 없는 파트넘버는 먼저 API로 동시 조회해 검색 캐시에 넣어 둠
+            # (아래 순차 조회에서는 캐시된 결과를 사용하고, 실패한 파트만 대화상자 표시)
+            prefetched, api_calls = self._prefetch_api_results(
+                [pn for pn in dict.fromkeys(part_numbers) if pn not in db_results], progress_detail
+            )
+            
+            last_progress_update = 0.0
+            
             # 선택한 행부터 끝까지 순환
-            for idx in range(start_row, len(self.current_df)):
-                part_number = str(self.current_df.iloc[idx][part_number_col]).strip()
-                
-                # 빈 값 건너뛰기
-                if not part_number or part_number == 'nan':
-                    continue
-                
+            for idx, part_number in zip(row_positions, part_numbers):
+                # 중지 버튼은 화면 갱신(root.update) 중에 처리되며, 다음 파트부터 조회하지 않음
+                if self._query_cancelled:
+                    break
                 queried_count += 1
                 
                 # v1.2.5: 진행 상황 업데이트 (전체/조회 완료 개수 표시)
-                progress_count_label.config(text=f"조회 진행: {queried_count} / {total_parts}개")
-                progress_detail.config(text=f"조회 중: {part_number} (Row {idx})\nDB: {db_hits}건 | API: {api_calls}건")
-                progress_bar['value'] = queried_count
-                self.root.update()
+                # 일정 간격마다, 또는 API 조회가 필요한 행(오래 걸림)과 마지막 행에서만 화면 갱신
+                now = time.monotonic()
+                if (now - last_progress_update >= PROGRESS_UPDATE_INTERVAL
+                        or (part_number not in db_results and part_number not in prefetched)
+                        or queried_count == total_parts):
+                    last_progress_update = now
+                    progress_count_label.config(text=f"조회 진행: {queried_count} / {total_parts}개")
+                    progress_detail.config(text=f"조회 중: {part_number} (Row {idx})\nDB: {db_hits}건 | API: {api_calls}건")
+                    progress_bar['value'] = queried_count
+                    self.root.update()
                 
                 result = None
                 part_api_calls = 0  # 이 파트넘버 조회 시 실제 API 호출 횟수
@@ -1051,18 +1541,22 @@ class DigikeyViewerApp:
                 # v1.2.6: 새로운 재시도 로직 사용 (정리 → 웹 검색 옵션 제공)
                 try:
                     # DB에서 먼저 조회 (성공한 경우만)
-                    db_result = self.part_db.get_part(part_number)
+                    # 일괄 조회 이후 이 조회 중에 저장된 파트(시트 내 중복 파트넘버)는 get_part로 확인
+                    db_result = db_results.get(part_number) or self.part_db.get_part(part_number)
                     if db_result and not self.is_query_failed(db_result):
                         result = db_result
                         db_hits += 1
+                    elif db_result:
+                        # 이전에 실패로 저장된 파트는 재시도 로직도 DB 결과를 그대로 반환하므로 바로 사용
+                        result = db_result
                     else:
-                        # DB에 없거나 실패한 경우 재시도 로직 사용
+                        # DB에 없는 경우 재시도 로직 사용
                         result, part_api_calls = self.query_part_with_retry(part_number, idx, progress_window)
                         api_calls += part_api_calls  # 실제 API 호출 횟수 추가
                             
                 except RateLimitExceeded as e:
                     # API 호출 한도 초과 시 조회 중단
-                    progress_window.destroy()
+                    self._hide_progress_window()
                     
                     # 재시도 시간 정보 포함 메시지
                     retry_info = ""
@@ -1122,7 +1616,7 @@ class DigikeyViewerApp:
             # 조회 탭으로 전환
             self.notebook.select(1)
             
-            progress_window.destroy()
+            self._hide_progress_window()
             
             # API 통계 라벨 업데이트
             self.update_api_stats_label()
@@ -1131,9 +1625,15 @@ class DigikeyViewerApp:
             today_total_calls = self.part_db.get_today_api_calls()
             remaining_calls = max(0, self.api_daily_limit - today_total_calls)
             
+            if self._close_requested:
+                return
+            if self._query_cancelled:
+                title, summary = "조회 중지", f"{len(query_results)}개의 파트넘버를 조회한 뒤 중지되었습니다."
+            else:
+                title, summary = "조회 완료", f"{len(query_results)}개의 파트넘버 조회가 완료되었습니다."
             messagebox.showinfo(
-                "조회 완료", 
-                f"{len(query_results)}개의 파트넘버 조회가 완료되었습니다.\n\n"
+                title, 
+                f"{summary}\n\n"
                 f"조회 통계:\n"
                 f"  - 데이터베이스에서 조회: {db_hits}건\n"
                 f"  - API 호출: {api_calls}건\n\n"
@@ -1144,14 +1644,149 @@ class DigikeyViewerApp:
             )
             
         except Exception as e:
-            progress_window.destroy()
+            self._hide_progress_window()
             messagebox.showerror("오류", f"조회 중 오류가 발생했습니다:\n{str(e)}")
     
+    def _prefetch_api_results(self, part_numbers: list, progress_detail=None) -> tuple:
+        """
+        API 검색 결과를 여러 스레드로 미리 조회하여 DigikeyAPIClient 검색 캐시에 저장
+        
+        대화상자가 필요한 재시도(정리/유사 자재/웹 검색)는 하지 않으며, 오늘 남은 호출 수만큼만 조회한다.
+        호출 한도 초과 시에는 미리 조회를 멈추고 나머지는 순차 조회에 맡긴다.
+        
+        Args:
+            part_numbers: 조회할 파트넘버 목록 (중복 없음)
+            progress_detail: 진행 상황 라벨 (선택적)
+            
+        Returns:
+            tuple: (미리 조회한 파트넘버 집합, API 호출 횟수)
+        """
+        if not part_numbers or not self.digikey_api.is_configured():
+            return (set(), 0)
+        
+        prefetched = {pn for pn in part_numbers if self.digikey_api.is_search_cached(pn)}  # 이미 캐시된 파트넘버 포함
+        remaining_calls = self.api_daily_limit - self.part_db.get_today_api_calls()
+        pending = [pn for pn in part_numbers if pn not in prefetched][:max(0, remaining_calls)]
+        
+        if not pending:
+            return (prefetched, 0)
+        
+        # 파트넘버마다 작업 스레드에 바로 제출하고, 메인 스레드는 root.after로 완료 여부만 확인
+        # (조회 중에도 진행 상황 창이 갱신되고 중지 버튼이 바로 동작함)
+        executor = ThreadPoolExecutor(max_workers=API_PREFETCH_WORKERS)
+        futures = {executor.submit(self.digikey_api.search_part, pn): pn for pn in pending}
+        def on_future_done(future):
+            # 한도 초과 시 아직 시작하지 않은 요청은 취소 (작업 스레드에서 호출됨)
+            if not future.cancelled() and isinstance(future.exception(), RateLimitExceeded):
+                for other in futures:
+                    other.cancel()
+        
+        for future in futures:
+            future.add_done_callback(on_future_done)
+        
+        finished_var = tk.BooleanVar(master=self.root, value=False)
+        
+        def poll():
+            if self._query_cancelled:
+                for future in futures:
+                    future.cancel()
+            done_count = sum(1 for future in futures if future.done())
+            if progress_detail is not None and progress_detail.winfo_exists():
+                progress_detail.config(text=f"API 동시 조회 중: {done_count} / {len(pending)}개")
+            if done_count == len(futures):
+                finished_var.set(True)
+            else:
+                self.root.after(API_PREFETCH_POLL_MS, poll)
+        
+        poll()
+        # 모든 요청이 끝나거나 취소될 때까지 이벤트 루프를 계속 처리하며 대기
+        self.root.wait_variable(finished_var)
+        executor.shutdown(wait=False)
+        
+        api_call_count = 0
+        for future, pn in futures.items():
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                # 한도 초과 등으로 실패한 요청은 결과가 캐시된 경우만 호출된 것으로 기록
+                if not isinstance(error, RateLimitExceeded):
+                    print(f"API 미리 조회 오류 ({pn}): {str(error)}")
+                if not self.digikey_api.is_search_cached(pn):
+                    continue
+            api_call_count += 1
+            self.part_db.increment_api_call()
+            # 오류 결과는 캐시되지 않으므로 순차 조회에서 다시 시도됨
+            if self.digikey_api.is_search_cached(pn):
+                prefetched.add(pn)
+        
+        return (prefetched, api_call_count)
+    
+    def _show_progress_window(self, total_parts: int) -> tuple:
+        """
+        연속 조회 진행 상황 창 표시 (처음 한 번만 만들고 이후에는 숨겨 둔 창을 초기화하여 재사용)
+        
+        Args:
+            total_parts: 전체 조회할 파트넘버 개수
+            
+        Returns:
+            tuple: (창, 진행 개수 라벨, 상세 라벨, 진행률 바)
+        """
+        # 사용자가 창을 닫아 파괴된 경우에는 새로 만듦
+        if self._progress_widgets is None or not self._progress_widgets[0].winfo_exists():
+            progress_window = self._new_toplevel()
+            progress_window.title("조회 중...")
+            progress_window.resizable(False, False)
+            
+            progress_label = ttk.Label(progress_window, text="파트넘버를 조회하고 있습니다...", font=self.font_heading)
+            progress_label.pack(pady=10)
+            
+            # v1.2.4: 진행 상황 표시 (전체/조회 완료)
+            progress_count_label = ttk.Label(progress_window, text="", font=self.font_small)
+            progress_count_label.pack(pady=2)
+            
+            progress_detail = ttk.Label(progress_window, text="", font=self.font_note)
+            progress_detail.pack(pady=5)
+            
+            # 진행률 바 추가
+            progress_bar = ttk.Progressbar(progress_window, length=400, mode='determinate')
+            progress_bar.pack(pady=5)
+            
+            # 중지 버튼 (창 닫기도 중지로 처리 - 조회 중에 위젯이 파괴되지 않게 함)
+            self._progress_cancel_button = ttk.Button(progress_window, text="중지", command=self._cancel_query)
+            self._progress_cancel_button.pack(pady=5)
+            progress_window.protocol("WM_DELETE_WINDOW", self._cancel_query)
+            
+            self._progress_widgets = (progress_window, progress_count_label, progress_detail, progress_bar)
+        
+        progress_window, progress_count_label, progress_detail, progress_bar = self._progress_widgets
+        progress_count_label.config(text=f"조회 진행: 0 / {total_parts}개")
+        progress_detail.config(text="")
+        progress_bar.config(maximum=total_parts, value=0)
+        self._query_cancelled = False
+        self._progress_cancel_button.config(state=tk.NORMAL, text="중지")
+        progress_window.deiconify()
+        
+        # 창 중앙 배치
+        _center_window(progress_window, 450, 190)
+        
+        return self._progress_widgets
+    
+    def _cancel_query(self):
+        """연속 조회 중지 요청 (진행 중인 파트까지 조회한 뒤 결과를 표시하고 멈춤)"""
+        self._query_cancelled = True
+        if self._progress_cancel_button is not None and self._progress_cancel_button.winfo_exists():
+            self._progress_cancel_button.config(state=tk.DISABLED, text="중지 중...")
+    
+    def _hide_progress_window(self):
+        """진행 상황 창 숨기기 (다음 조회에서 재사용)"""
+        if self._progress_widgets is not None and self._progress_widgets[0].winfo_exists():
+            self._progress_widgets[0].withdraw()
+    
     def display_query_results(self):
         """조회 결과를 트리뷰에 표시"""
-        # 기존 항목 삭제
-        for item in self.tree2.get_children():
-            self.tree2.delete(item)
+        # 기존 항목 삭제 (한 번의 호출로 모두 삭제)
+        self.tree2.delete(*self.tree2.get_children())
         
         if not self.query_results:
             return
@@ -1173,15 +1808,14 @@ class DigikeyViewerApp:
         self.tree2.column('Manufacturer', width=200, anchor=tk.W)
         self.tree2.column('MountingType', width=150, anchor=tk.W)
         
-        # 데이터 삽입
-        for i, result in enumerate(self.query_results):
-            values = [
-                str(result['Row']),
-                result['PartNumber'],
-                result['Manufacturer'],
-                result['MountingType']
-            ]
-            self.tree2.insert("", tk.END, values=values, iid=i)
+        # 데이터 삽입 (표시할 값을 먼저 모두 만들어 두고 삽입만 반복)
+        rows = [
+            (str(result['Row']), result['PartNumber'], result['Manufacturer'], result['MountingType'])
+            for result in self.query_results
+        ]
+        insert = self.tree2.insert
+        for i, values in enumerate(rows):
+            insert("", tk.END, values=values, iid=i)
     
     def on_query_result_double_click(self, event):
         """조회 결과 더블클릭 시 상세정보 표시"""
@@ -1203,29 +1837,28 @@ class DigikeyViewerApp:
         self.detail_text.config(state=tk.NORMAL)
         self.detail_text.delete(1.0, tk.END)
         
-        # 기존 태그 삭제
-        for tag in self.detail_text.tag_names():
-            self.detail_text.tag_delete(tag)
+        # 이전에 표시한 링크 범위 초기화 (태그 설정/바인딩은 유지)
+        self._detail_urls = []
         
         full_data = result_data.get('FullData', {})
         
-        # 기본 정보
-        info_text = "=== 파트넘버 상세정보 ===\n\n"
+        # 기본 정보 (줄 목록을 모아 한 번에 삽입)
+        info_lines = ["=== 파트넘버 상세정보 ===\n"]
         
         # 데이터 출처 표시
         source = full_data.get('Source', 'API')
-        info_text += f"데이터 출처: {source}\n"
+        info_lines.append(f"데이터 출처: {source}")
         if source == 'Database':
-            info_text += f"생성일시: {full_data.get('CreatedAt', 'N/A')}\n"
-            info_text += f"수정일시: {full_data.get('UpdatedAt', 'N/A')}\n"
-        info_text += "\n"
+            info_lines.append(f"생성일시: {full_data.get('CreatedAt', 'N/A')}")
+            info_lines.append(f"수정일시: {full_data.get('UpdatedAt', 'N/A')}")
+        info_lines.append("")
         
-        info_text += f"Row: {result_data.get('Row', 'N/A')}\n"
-        info_text += f"파트넘버: {result_data.get('PartNumber', 'N/A')}\n"
-        info_text += f"제조업체: {result_data.get('Manufacturer', 'N/A')}\n"
-        info_text += f"마운팅타입: {result_data.get('MountingType', 'N/A')}\n\n"
+        info_lines.append(f"Row: {result_data.get('Row', 'N/A')}")
+        info_lines.append(f"파트넘버: {result_data.get('PartNumber', 'N/A')}")
+        info_lines.append(f"제조업체: {result_data.get('Manufacturer', 'N/A')}")
+        info_lines.append(f"마운팅타입: {result_data.get('MountingType', 'N/A')}\n\n")
         
-        self.detail_text.insert(tk.END, info_text)
+        self.detail_text.insert(tk.END, "\n".join(info_lines))
         
         # URL 정보 처리 (링크로 표시)
         if 'error' not in full_data:
@@ -1235,49 +1868,28 @@ class DigikeyViewerApp:
             product_url = full_data.get('ProductUrl', '')
             if product_url:
                 self.detail_text.insert(tk.END, "제품 상세정보: ")
-                url_start = self.detail_text.index(tk.INSERT)
-                self.detail_text.insert(tk.END, product_url)
-                url_end = self.detail_text.index(tk.INSERT)
+                self._insert_detail_link(product_url)
                 self.detail_text.insert(tk.END, "\n")
-                
-                # 링크 태그 생성 및 적용
-                tag_name = f"product_url_{id(product_url)}"
-                self.detail_text.tag_add(tag_name, url_start, url_end)
-                self.detail_text.tag_config(tag_name, foreground="blue", underline=True)
-                self.detail_text.tag_bind(tag_name, "<Button-1>", lambda e, url=product_url: self.open_url(url))
-                self.detail_text.tag_bind(tag_name, "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
-                self.detail_text.tag_bind(tag_name, "<Leave>", lambda e: self.detail_text.config(cursor=""))
             
             # 데이터시트 URL
             datasheet_url = full_data.get('DatasheetUrl', '')
             if datasheet_url:
                 self.detail_text.insert(tk.END, "데이터시트 URL: ")
-                url_start = self.detail_text.index(tk.INSERT)
-                self.detail_text.insert(tk.END, datasheet_url)
-                url_end = self.detail_text.index(tk.INSERT)
+                self._insert_detail_link(datasheet_url)
                 self.detail_text.insert(tk.END, "\n")
-                
-                # 링크 태그 생성 및 적용
-                tag_name = f"datasheet_url_{id(datasheet_url)}"
-                self.detail_text.tag_add(tag_name, url_start, url_end)
-                self.detail_text.tag_config(tag_name, foreground="blue", underline=True)
-                self.detail_text.tag_bind(tag_name, "<Button-1>", lambda e, url=datasheet_url: self.open_url(url))
-                self.detail_text.tag_bind(tag_name, "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
-                self.detail_text.tag_bind(tag_name, "<Leave>", lambda e: self.detail_text.config(cursor=""))
-            
-            # 기타 정보
+            
+            # 기타 정보 (항목마다 위젯에 삽입하지 않고 모아서 한 번에 삽입)
+            extra_lines = []
             for key, value in full_data.items():
                 # 이미 표시한 항목이나 URL 항목 제외
-                if key not in ['Manufacturer', 'MountingType', 'ProductUrl', 'DatasheetUrl', 'Source', 'CreatedAt', 'UpdatedAt']:
+                if key not in _DETAIL_SHOWN_KEYS:
                     # 딕셔너리나 리스트인 경우 문자열로 변환
                     if isinstance(value, dict):
-                        value_str = ", ".join([f"{k}: {v}" for k, v in value.items()])
-                        self.detail_text.insert(tk.END, f"{key}: {value_str}\n")
+                        value = ", ".join(f"{k}: {v}" for k, v in value.items())
                     elif isinstance(value, list):
-                        value_str = ", ".join([str(v) for v in value])
-                        self.detail_text.insert(tk.END, f"{key}: {value_str}\n")
-                    else:
-                        self.detail_text.insert(tk.END, f"{key}: {value}\n")
+                        value = ", ".join(map(str, value))
+                    extra_lines.append(f"{key}: {value}\n")
+            self.detail_text.insert(tk.END, "".join(extra_lines))
         else:
             # v1.2.4: 조회 실패한 파트넘버에 웹 검색 링크 추가
             error_msg = full_data.get('error', '알 수 없는 오류')
@@ -1290,30 +1902,55 @@ class DigikeyViewerApp:
                 self.detail_text.insert(tk.END, "디지키 웹사이트에서 검색: ")
                 
                 # 디지키 검색 URL 생성
-                search_url = f"https://www.digikey.com/en/products?keywords={part_number}"
-                url_start = self.detail_text.index(tk.INSERT)
-                self.detail_text.insert(tk.END, search_url)
-                url_end = self.detail_text.index(tk.INSERT)
+                search_url = f"https://www.digikey.com/en/products?keywords={quote_plus(part_number)}"
+                self._insert_detail_link(search_url)
                 self.detail_text.insert(tk.END, "\n")
-                
-                # 링크 태그 생성 및 적용
-                tag_name = f"search_url_{id(search_url)}"
-                self.detail_text.tag_add(tag_name, url_start, url_end)
-                self.detail_text.tag_config(tag_name, foreground="blue", underline=True)
-                self.detail_text.tag_bind(tag_name, "<Button-1>", lambda e, url=search_url: self.open_url(url))
-                self.detail_text.tag_bind(tag_name, "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
-                self.detail_text.tag_bind(tag_name, "<Leave>", lambda e: self.detail_text.config(cursor=""))
         
         # 텍스트 위젯을 다시 읽기 전용으로 변경
         self.detail_text.config(state=tk.DISABLED)
     
+    def _insert_detail_link(self, url):
+        """
+        상세정보 텍스트 끝에 URL을 링크로 삽입
+        
+        Args:
+            url: 표시하고 열 URL
+        """
+        url_start = self.detail_text.index(tk.END + "-1c")
+        self.detail_text.insert(tk.END, url, "url_link")
+        url_end = self.detail_text.index(tk.END + "-1c")
+        self._detail_urls.append((url_start, url_end, url))
+    
+    def _on_detail_url_click(self, event):
+        """클릭 위치가 속한 링크 범위를 찾아 해당 URL 열기"""
+        index = self.detail_text.index(f"@{event.x},{event.y}")
+        for url_start, url_end, url in self._detail_urls:
+            if (self.detail_text.compare(url_start, "<=", index)
+                    and self.detail_text.compare(index, "<", url_end)):
+                self.open_url(url)
+                return "break"
+    
     def open_url(self, url):
         """웹브라우저에서 URL 열기"""
         try:
-            webbrowser.open(url)
+            self._get_browser().open(url)
         except Exception as e:
             messagebox.showerror("오류", f"URL을 열 수 없습니다:\n{url}\n\n{str(e)}")
     
+    def _get_browser(self):
+        """
+        기본 웹브라우저 컨트롤러 반환 (처음 한 번만 찾고 이후 재사용)
+        
+        Returns:
+            webbrowser 컨트롤러 (찾지 못하면 webbrowser 모듈 자체를 사용)
+        """
+        if self._browser is None:
+            try:
+                self._browser = webbrowser.get()
+            except webbrowser.Error:
+                self._browser = webbrowser
+        return self._browser
+    
     def check_api_config_after_setup(self):
         """유저폼 완료 후 API 설정 확인"""
         # config 파일에서 읽은 후에도 API 설정이 없을 때만 물어봄
@@ -1342,26 +1979,47 @@ class DigikeyViewerApp:
         if not self.root.winfo_viewable():
             self.root.deiconify()
         
-        settings_window = tk.Toplevel(self.root)
-        settings_window.title("디지키 API 설정")
-        settings_window.geometry("500x400")
-        settings_window.transient(self.root)
+        # 이전에 만든 창이 있으면 위젯을 다시 만들지 않고 입력값만 현재 설정으로 채워서 다시 표시
+        if self._settings_widgets is None or not self._settings_widgets[0].winfo_exists():
+            self._settings_widgets = self._build_api_settings_window()
+        settings_window, reset_fields = self._settings_widgets
+        reset_fields()
+        
+        settings_window.deiconify()
         settings_window.grab_set()  # 모달 다이얼로그
         settings_window.focus_set()  # 포커스 설정
         settings_window.lift()  # 다른 창 위로 올리기
+    
+    def _build_api_settings_window(self):
+        """
+        디지키 API 설정 창 생성 (닫기/저장/취소 시 파괴하지 않고 숨김)
+        
+        Returns:
+            tuple: (설정 창, 입력값을 현재 API 설정으로 되돌리는 함수)
+        """
+        settings_window = self._new_toplevel()
+        settings_window.title("디지키 API 설정")
+        settings_window.transient(self.root)
+        
+        def hide_window():
+            if saved_label._hide_job is not None:
+                settings_window.after_cancel(saved_label._hide_job)
+                saved_label._hide_job = None
+            saved_label.config(text="")
+            settings_window.grab_release()
+            settings_window.withdraw()
+        
+        settings_window.protocol("WM_DELETE_WINDOW", hide_window)
         
         # 창 중앙 배치
-        settings_window.update_idletasks()
-        x = (settings_window.winfo_screenwidth() // 2) - (settings_window.winfo_width() // 2)
-        y = (settings_window.winfo_screenheight() // 2) - (settings_window.winfo_height() // 2)
-        settings_window.geometry(f"+{x}+{y}")
+        _center_window(settings_window, 500, 400)
         
         # 메인 프레임
         main_frame = ttk.Frame(settings_window, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
         # 제목 및 안내
-        ttk.Label(main_frame, text="디지키 API 설정", font=("Arial", 12, "bold")).pack(pady=(0, 10))
+        ttk.Label(main_frame, text="디지키 API 설정", font=self.font_title).pack(pady=(0, 10))
         ttk.Label(
             main_frame, 
             text="디지키 개발자 포털(developer.digikey.com)에서 받은\nClient ID와 Client Secret을 입력하세요.",
@@ -1374,16 +2032,16 @@ class DigikeyViewerApp:
         env_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(env_frame, text="환경:", width=15).grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        env_var = tk.BooleanVar(value=self.digikey_api.use_sandbox)
-        ttk.Radiobutton(env_frame, text="샌드박스", variable=env_var, value=True).grid(row=0, column=1, padx=5, sticky=tk.W)
-        ttk.Radiobutton(env_frame, text="프로덕션", variable=env_var, value=False).grid(row=0, column=2, padx=5, sticky=tk.W)
+        env_var = tk.IntVar()  # 1: 샌드박스, 0: 프로덕션
+        ttk.Radiobutton(env_frame, text="샌드박스", variable=env_var, value=1).grid(row=0, column=1, padx=5, sticky=tk.W)
+        ttk.Radiobutton(env_frame, text="프로덕션", variable=env_var, value=0).grid(row=0, column=2, padx=5, sticky=tk.W)
         
         ttk.Label(
             main_frame, 
             text="※ 샌드박스 키는 샌드박스 환경, 프로덕션 키는 프로덕션 환경을 선택하세요",
             justify=tk.CENTER,
             foreground="red",
-            font=("Arial", 8)
+            font=self.font_note
         ).pack(pady=(0, 10))
         
         # 입력 프레임
@@ -1391,40 +2049,83 @@ class DigikeyViewerApp:
         input_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(input_frame, text="Client ID:", width=15).grid(row=0, column=0, padx=5, pady=10, sticky=tk.W)
-        client_id_entry = ttk.Entry(input_frame, width=35)
+        client_id_var = tk.StringVar()
+        client_id_entry = ttk.Entry(input_frame, width=35, textvariable=client_id_var)
         client_id_entry.grid(row=0, column=1, padx=5, pady=10, sticky=(tk.W, tk.E))
-        if self.digikey_api.client_id:
-            client_id_entry.insert(0, self.digikey_api.client_id)
         
         ttk.Label(input_frame, text="Client Secret:", width=15).grid(row=1, column=0, padx=5, pady=10, sticky=tk.W)
-        client_secret_entry = ttk.Entry(input_frame, width=35, show="*")
+        client_secret_var = tk.StringVar()
+        client_secret_entry = ttk.Entry(input_frame, width=35, show="*", textvariable=client_secret_var)
         client_secret_entry.grid(row=1, column=1, padx=5, pady=10, sticky=(tk.W, tk.E))
-        if self.digikey_api.client_secret:
-            client_secret_entry.insert(0, self.digikey_api.client_secret)
+        
+        secret_status_label = ttk.Label(input_frame, text="", foreground="red", font=self.font_note)
+        secret_status_label.grid(row=2, column=1, padx=5, sticky=tk.W)
+        
+        def validate_secret():
+            client_secret_entry._validate_job = None
+            secret = client_secret_var.get()
+            if not secret.strip():
+                secret_status_label.config(text="Client Secret을 입력하세요.")
+            elif secret != secret.strip():
+                secret_status_label.config(text="앞뒤 공백은 저장 시 제거됩니다.")
+            else:
+                secret_status_label.config(text="")
+        
+        def cancel_validate_secret(event=None):
+            if client_secret_entry._validate_job is not None:
+                self.root.after_cancel(client_secret_entry._validate_job)
+                client_secret_entry._validate_job = None
+        
+        def schedule_validate_secret(event=None):
+            # 키 입력마다 검사하지 않고 입력이 멈춘 뒤 한 번만 검사
+            cancel_validate_secret()
+            client_secret_entry._validate_job = self.root.after(SECRET_VALIDATE_DELAY_MS, validate_secret)
+        
+        client_secret_entry._validate_job = None
+        client_secret_entry.bind("<KeyRelease>", schedule_validate_secret)
+        client_secret_entry.bind("<Destroy>", cancel_validate_secret)
         
         input_frame.columnconfigure(1, weight=1)
         
+        def reset_fields():
+            cancel_validate_secret()
+            secret_status_label.config(text="")
+            env_var.set(int(self.digikey_api.use_sandbox))
+            client_id_var.set(self.digikey_api.client_id or "")
+            client_secret_var.set(self.digikey_api.client_secret or "")
+        
+        # 저장 결과 문구 (메시지 상자 대신 창 안에 잠시 표시한 뒤 창을 숨김)
+        saved_label = ttk.Label(main_frame, text="", foreground="green")
+        saved_label.pack()
+        saved_label._hide_job = None
+        
+        def show_saved(text):
+            saved_label.config(text=text)
+            settings_window.grab_release()
+            if saved_label._hide_job is None:
+                saved_label._hide_job = settings_window.after(SETTINGS_SAVED_HIDE_MS, hide_window)
+        
         # 버튼 프레임
         button_frame = ttk.Frame(main_frame)
-        button_frame.pack(pady=30, fill=tk.X)
+        button_frame.pack(pady=(10, 0), fill=tk.X)
         
         def save_settings():
-            client_id = client_id_entry.get().strip()
-            client_secret = client_secret_entry.get().strip()
-            use_sandbox = env_var.get()
+            client_id = client_id_var.get().strip()
+            client_secret = client_secret_var.get().strip()
+            use_sandbox = env_var.get() == 1
             
             if client_id and client_secret:
+                # 현재 적용된 설정과 같으면 config 파일을 다시 쓰지 않음
+                current = (self.digikey_api.client_id, self.digikey_api.client_secret, self.digikey_api.use_sandbox)
+                if (client_id, client_secret, use_sandbox) == current:
+                    show_saved("변경사항 없음")
+                    return
+                
                 self.digikey_api.set_credentials(client_id, client_secret)
                 self.digikey_api.use_sandbox = use_sandbox
-                self.digikey_api.base_url = (
-                    self.digikey_api.SANDBOX_BASE_URL 
-                    if use_sandbox 
-                    else self.digikey_api.PRODUCTION_BASE_URL
-                )
                 # config 파일에 저장
                 self.save_config(client_id, client_secret, use_sandbox)
-                messagebox.showinfo("성공", "API 설정이 저장되었습니다.\nconfig.txt 파일에도 저장되었습니다.")
-                settings_window.destroy()
+                show_saved("저장됨 ✓ (config.txt)")
             else:
                 messagebox.showwarning("경고", "Client ID와 Client Secret을 모두 입력해주세요.")
         
@@ -1433,8 +2134,10 @@ class DigikeyViewerApp:
         save_btn.pack(side=tk.LEFT, padx=10, expand=True)
         
         # 취소 버튼
-        cancel_btn = ttk.Button(button_frame, text="취소", command=settings_window.destroy, width=18)
+        cancel_btn = ttk.Button(button_frame, text="취소", command=hide_window, width=18)
         cancel_btn.pack(side=tk.LEFT, padx=10, expand=True)
+        
+        return settings_window, reset_fields
     
     def update_api_stats_label(self):
         """API 통계 라벨 업데이트"""
@@ -1486,16 +2189,12 @@ class DigikeyViewerApp:
             remaining = max(0, self.api_daily_limit - today_calls)
             
             # 통계 윈도우 생성
-            stats_window = tk.Toplevel(self.root)
+            stats_window = self._new_toplevel()
             stats_window.title("API 호출 통계")
-            stats_window.geometry("500x600")
             stats_window.transient(self.root)
             
             # 창 중앙 배치
-            stats_window.update_idletasks()
-            x = (stats_window.winfo_screenwidth() // 2) - (stats_window.winfo_width() // 2)
-            y = (stats_window.winfo_screenheight() // 2) - (stats_window.winfo_height() // 2)
-            stats_window.geometry(f"+{x}+{y}")
+            _center_window(stats_window, 500, 600)
             
             # 메인 프레임
             main_frame = ttk.Frame(stats_window, padding="20")
@@ -1508,8 +2207,13 @@ class DigikeyViewerApp:
             today_frame = ttk.LabelFrame(main_frame, text="오늘 통계", padding="10")
             today_frame.pack(fill=tk.X, pady=10)
             
-            ttk.Label(today_frame, text=f"총 호출: {today_calls}회", font=("Arial", 11)).pack(anchor=tk.W, pady=2)
-            ttk.Label(today_frame, text=f"일일 한도: {self.api_daily_limit}회", font=("Arial", 11)).pack(anchor=tk.W, pady=2)
+            # 색상이 같은 줄은 여러 줄 라벨 하나로 표시 (남은 호출만 색상이 달라 별도 라벨)
+            ttk.Label(
+                today_frame,
+                text=f"총 호출: {today_calls}회\n일일 한도: {self.api_daily_limit}회",
+                font=("Arial", 11),
+                justify=tk.LEFT
+            ).pack(anchor=tk.W, pady=2)
             ttk.Label(
                 today_frame, 
                 text=f"남은 호출: {remaining}회",
@@ -1531,7 +2235,7 @@ class DigikeyViewerApp:
             progress_bar.pack(fill=tk.X)
             
             percentage = (today_calls / self.api_daily_limit * 100) if self.api_daily_limit > 0 else 0
-            ttk.Label(progress_frame, text=f"{percentage:.1f}% 사용", font=("Arial", 9)).pack(anchor=tk.E, pady=2)
+            ttk.Label(progress_frame, text=f"{percentage:.1f}% 사용", font=self.font_small).pack(anchor=tk.E, pady=2)
             
             # 최근 호출 통계 프레임
             history_frame = ttk.LabelFrame(main_frame, text="최근 30일 호출 이력", padding="10")
@@ -1570,25 +2274,39 @@ class DigikeyViewerApp:
     
     def on_closing(self):
         """프로그램 종료 처리"""
-        # 열려있는 모든 Toplevel 윈도우 닫기
-        for widget in self.root.winfo_children():
-            if isinstance(widget, tk.Toplevel):
-                try:
-                    widget.destroy()
-                except:
-                    pass
+        # 연속 조회 중(중첩된 이벤트 루프 안)에는 창과 DB를 바로 닫지 않고 중지만 요청
+        # (조회가 정리되면 on_part_double_click에서 다시 호출)
+        if self._query_running:
+            self._close_requested = True
+            self._cancel_query()
+            return
+        
+        # 열려있는 모든 Toplevel 윈도우 닫기 (창 안의 after 작업도 Destroy 시 취소됨)
+        for window in list(self._open_toplevels):
+            if window.winfo_exists():
+                window.destroy()
+        
+        # 아직 기록 중인 config.txt 저장 완료 대기
+        self._config_queue.join()
         
         # 데이터베이스 연결 종료
         if hasattr(self, 'part_db') and self.part_db:
             self.part_db.close()
         
-        # 메인 윈도우 종료
-        self.root.quit()
+        # API HTTP 세션 종료
+        self.digikey_api.close()
+        
+        # 아직 시트를 읽지 않아 열려 있는 엑셀 파일 닫기
+        self.excel_handler.close()
+        
+        # 메인 윈도우 종료 (destroy만으로 mainloop도 종료됨)
         self.root.destroy()
 
 
 def main():
     """메인 함수"""
+    # 모듈 로그(logging)를 콘솔에 출력
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     root = tk.Tk()
     app = DigikeyViewerApp(root)
     root.mainloop()